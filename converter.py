@@ -1,15 +1,27 @@
 import argparse
 import concurrent.futures
+import glob
+import hashlib
+import importlib
+import json
 import logging
 import multiprocessing
+import os
+import shutil
+import socket
 import sys
+import threading
 import time
-from collections import Counter
+from collections import Counter, deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
 
-from pdf2docx import Converter
-from tqdm import tqdm
+# pdf2docx (PyMuPDF, python-docx, OpenCV, NumPy) and tqdm are imported lazily
+# where they are used, so --help, --list, --dry-run and importing this module
+# from the GUI stay fast.
+if TYPE_CHECKING:
+    from pdf2docx import Converter
 
 # Configure logging
 logging.basicConfig(
@@ -21,7 +33,94 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-Result = Tuple[str, Path, str]
+# (status, pdf_path, error_message, error_code)
+Result = Tuple[str, Path, str, str]
+
+# Error codes returned by convert_single
+ERR_NOT_FOUND = "not_found"
+ERR_EMPTY = "empty"
+ERR_MEMORY = "memory"
+ERR_PERMISSION = "permission"
+ERR_IO = "io"
+ERR_TIMEOUT = "timeout"
+ERR_CONVERSION = "conversion"
+ERR_UNKNOWN = "unknown"
+
+# Errors worth retrying (locked files, NFS hiccups, memory pressure, and
+# anything not recognised, which must not get a good PDF quarantined)
+TRANSIENT_ERRORS = frozenset({ERR_MEMORY, ERR_PERMISSION, ERR_IO, ERR_UNKNOWN})
+# Errors that will repeat until the PDF changes; those files are quarantined
+DETERMINISTIC_ERRORS = frozenset({ERR_EMPTY, ERR_CONVERSION})
+
+# pdf2docx and PyMuPDF exceptions meaning the PDF itself cannot be parsed.
+# Matched by class name so neither library has to be imported to classify.
+PARSE_ERROR_NAMES = frozenset({"ConversionException", "MakedocxException", "FileDataError", "EmptyFileError"})
+# MuPDF reports allocation failures as RuntimeError with one of these messages
+MEMORY_ERROR_MARKERS = ("out of memory", "cannot allocate", "malloc")
+
+QUARANTINE_FILENAME = ".pdf2docx_quarantine.json"
+# A PDF that hits --timeout-per-file this many times (same size/mtime) is quarantined
+QUARANTINE_AFTER_TIMEOUTS = 2
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF_SECS = 2.0
+
+# Profiling of slow documents
+PROFILE_DIRNAME = ".pdf2docx_profiles"
+PROFILE_SAMPLE_INTERVAL_SECS = 0.01
+PROFILE_MAX_STACK_DEPTH = 64
+PROFILE_TOP_FUNCTIONS = 30
+
+# Page-range checkpoints for huge documents
+CHUNKS_DIRNAME = ".pdf2docx_chunks"
+CHECKPOINT_SOURCE_FILE = "source.txt"
+
+# Cross-process claims on output files (several CLI runs sharing --output)
+CLAIM_SUFFIX = ".lock"
+CLAIM_STALE_SECS = 300.0
+# Shorter expiries are unreliable with coarse (e.g. NFS) mtime resolution
+CLAIM_MIN_STALE_SECS = 5.0
+
+# Special value for --workers that enables runtime autoscaling
+AUTO_WORKERS = "auto"
+
+# Autoscaling thresholds
+AUTOSCALE_INTERVAL_SECS = 5.0
+AUTOSCALE_CPU_HIGH = 0.90
+AUTOSCALE_MEM_LOW = 0.10
+AUTOSCALE_MEM_GROW = 0.25
+AUTOSCALE_MAX_FACTOR = 2
+AUTOSCALE_WINDOW_COMPLETIONS = 3
+AUTOSCALE_MIN_GAIN = 0.05
+# Windows to wait after an unproductive increase; doubled on each repeat
+AUTOSCALE_HOLD_WINDOWS = 3
+AUTOSCALE_MAX_HOLD_WINDOWS = 48
+
+# Priority lanes: small files go to the fast lane, which keeps a share of workers
+LANE_FAST = "fast"
+LANE_BULK = "bulk"
+FAST_LANE_MAX_MB = 5.0
+FAST_LANE_SHARE = 0.25
+
+
+def workers_arg(value: str) -> Union[int, str]:
+    """
+    Parse the --workers option, accepting a positive integer or "auto".
+    
+    Args:
+        value: Raw command line value
+        
+    Returns:
+        Number of workers, or AUTO_WORKERS for adaptive mode
+    """
+    if value.strip().lower() == AUTO_WORKERS:
+        return AUTO_WORKERS
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inválido para workers: {value!r} (use un entero o 'auto')")
+    if workers < 1:
+        raise argparse.ArgumentTypeError("workers debe ser mayor o igual a 1")
+    return workers
 
 
 def parse_args() -> argparse.Namespace:
@@ -37,8 +136,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--output",
-        required=True,
-        help="Carpeta destino para los DOCX.",
+        help="Carpeta destino para los DOCX (obligatoria salvo con --list).",
     )
     parser.add_argument(
         "--pattern",
@@ -60,9 +158,29 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--workers",
-        type=int,
+        type=workers_arg,
         default=max(1, multiprocessing.cpu_count() - 1),
-        help="Numero de hilos concurrentes (por defecto CPU-1).",
+        help="Numero de hilos concurrentes (por defecto CPU-1), o 'auto' para ajustarlo "
+             "segun limites de cgroup, uso de CPU y memoria libre.",
+    )
+    parser.add_argument(
+        "--fast-lane-max-mb",
+        type=float,
+        default=FAST_LANE_MAX_MB,
+        help="PDFs de hasta este tamano (MB) van al carril rapido (por defecto 5; 0 desactiva los carriles).",
+    )
+    parser.add_argument(
+        "--fast-lane-share",
+        type=float,
+        default=FAST_LANE_SHARE,
+        help="Fraccion de workers reservada al carril rapido (por defecto 0.25).",
+    )
+    parser.add_argument(
+        "--priority",
+        dest="priority_files",
+        action="append",
+        default=None,
+        help="PDF de las entradas que va siempre al carril rapido, sea cual sea su tamano. Se puede repetir.",
     )
     parser.add_argument(
         "--max-files",
@@ -75,12 +193,89 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Tiempo maximo en segundos por archivo; si se excede, se marca error y se continua.",
     )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help="Reintentos para errores transitorios (archivo bloqueado, E/S, memoria). Por defecto 2.",
+    )
+    parser.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=DEFAULT_RETRY_BACKOFF_SECS,
+        help="Espera inicial en segundos entre reintentos; se duplica en cada intento (por defecto 2).",
+    )
+    parser.add_argument(
+        "--quarantine-file",
+        default=None,
+        help=f"Archivo JSON de cuarentena (por defecto <output>/{QUARANTINE_FILENAME}).",
+    )
+    parser.add_argument(
+        "--quarantine-after-timeouts",
+        type=int,
+        default=QUARANTINE_AFTER_TIMEOUTS,
+        help="Pone en cuarentena un PDF que excede --timeout-per-file esta cantidad de veces "
+             "sin haber cambiado (por defecto 2; 0 desactiva).",
+    )
+    parser.add_argument(
+        "--no-quarantine",
+        action="store_true",
+        help="No omite ni registra PDFs que fallan siempre (cuarentena desactivada).",
+    )
+    parser.add_argument(
+        "--profile-slow",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Perfila (muestreo de pila) los PDFs que tarden mas de SECONDS y guarda el perfil "
+             "con tiempos por etapa y por pagina.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=None,
+        help=f"Carpeta para los perfiles (por defecto <output>/{PROFILE_DIRNAME}).",
+    )
+    parser.add_argument(
+        "--chunk-pages",
+        type=int,
+        default=None,
+        help="Convierte PDFs con mas paginas en bloques de N paginas con checkpoints; "
+             "un reintento solo rehace los bloques que faltan.",
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        default=None,
+        help=f"Carpeta para los checkpoints por bloque (por defecto <output>/{CHUNKS_DIRNAME}).",
+    )
+    parser.add_argument(
+        "--claim-stale-secs",
+        type=float,
+        default=CLAIM_STALE_SECS,
+        help="Segundos sin actividad tras los cuales el bloqueo de otro proceso sobre un DOCX "
+             f"se considera abandonado (por defecto 300, minimo {CLAIM_MIN_STALE_SECS:g}).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Solo busca los PDFs y muestra que se haria con cada uno (no convierte).",
+    )
+    parser.add_argument(
+        "--list",
+        dest="list_only",
+        action="store_true",
+        help="Solo imprime las rutas de los PDFs encontrados, una por linea (para scripts).",
+    )
     parser.add_argument(
         "--overwrite",
         action="store_true",
         help="Reescribe DOCX existentes si ya hay un archivo convertido.",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not args.output and not args.list_only:
+        parser.error("--output es obligatorio (salvo con --list)")
+    if args.claim_stale_secs < CLAIM_MIN_STALE_SECS:
+        parser.error(f"--claim-stale-secs debe ser al menos {CLAIM_MIN_STALE_SECS:g}")
+    return args
 
 
 def expand_inputs(inputs: List[str], pattern: str, recursive: bool) -> List[Path]:
@@ -121,7 +316,829 @@ def expand_inputs(inputs: List[str], pattern: str, recursive: bool) -> List[Path
     return unique
 
 
-def convert_single(pdf_path: Path, output_dir: Path, overwrite: bool) -> Result:
+def _read_first_line(path: str) -> Optional[str]:
+    """Read the first line of a small system file, or None if unavailable."""
+    try:
+        with open(path, "r", encoding="ascii") as fh:
+            return fh.readline().strip()
+    except (OSError, ValueError):
+        return None
+
+
+def _read_cgroup_cpu_quota() -> Optional[float]:
+    """
+    Read the CPU quota imposed by cgroups (v2 or v1), in number of CPUs.
+    
+    Returns:
+        CPUs allowed by the quota, or None if there is no quota
+    """
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    line = _read_first_line("/sys/fs/cgroup/cpu.max")
+    if line:
+        parts = line.split()
+        if len(parts) == 2 and parts[0] != "max":
+            try:
+                return int(parts[0]) / int(parts[1])
+            except (ValueError, ZeroDivisionError):
+                return None
+        return None
+
+    # cgroup v1: quota of -1 means unlimited
+    for base in ("/sys/fs/cgroup/cpu", "/sys/fs/cgroup/cpu,cpuacct"):
+        quota = _read_first_line(f"{base}/cpu.cfs_quota_us")
+        period = _read_first_line(f"{base}/cpu.cfs_period_us")
+        if quota and period:
+            try:
+                quota_us, period_us = int(quota), int(period)
+            except ValueError:
+                return None
+            if quota_us > 0 and period_us > 0:
+                return quota_us / period_us
+            return None
+    return None
+
+
+def detect_cpu_limit() -> int:
+    """
+    Number of CPUs this process may actually use.
+    
+    Takes into account CPU affinity and cgroup quotas, so containers
+    (Docker, Kubernetes) are not oversubscribed.
+    
+    Returns:
+        Effective CPU count (at least 1)
+    """
+    cpus = os.cpu_count() or 1
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        pass
+
+    quota = _read_cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, int(quota)))
+    return max(1, cpus)
+
+
+def _read_meminfo() -> Tuple[Optional[int], Optional[int]]:
+    """Return (total, available) bytes from /proc/meminfo, or (None, None)."""
+    total = available = None
+    try:
+        with open("/proc/meminfo", "r", encoding="ascii") as fh:
+            for line in fh:
+                key, _, rest = line.partition(":")
+                if key == "MemTotal":
+                    total = int(rest.split()[0]) * 1024
+                elif key == "MemAvailable":
+                    available = int(rest.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None, None
+    return total, available
+
+
+def free_memory_fraction() -> Optional[float]:
+    """
+    Fraction of memory still available to this process.
+    
+    Uses the cgroup memory limit when one is set, otherwise the host memory.
+    
+    Returns:
+        Value between 0 and 1, or None if it cannot be measured on this platform
+    """
+    total, available = _read_meminfo()
+
+    # cgroup v2, then v1
+    for limit_file, usage_file in (
+        ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+        ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+    ):
+        limit = _read_first_line(limit_file)
+        usage = _read_first_line(usage_file)
+        if not limit or not usage or limit == "max":
+            continue
+        try:
+            limit_bytes, usage_bytes = int(limit), int(usage)
+        except ValueError:
+            continue
+        # v1 reports a huge number when there is no limit
+        if limit_bytes <= 0 or (total is not None and limit_bytes >= total):
+            continue
+        cgroup_free = max(0.0, (limit_bytes - usage_bytes) / limit_bytes)
+        if total and available is not None:
+            return min(cgroup_free, available / total)
+        return cgroup_free
+
+    if total and available is not None:
+        return available / total
+    return None
+
+
+def _own_cgroup(controller: str = "") -> Optional[str]:
+    """
+    This process's cgroup, as listed in /proc/self/cgroup.
+    
+    Args:
+        controller: cgroup v1 controller (e.g. "cpuacct"), or "" for the v2 hierarchy
+        
+    Returns:
+        Path relative to the hierarchy root, or None if it is not listed
+    """
+    try:
+        with open("/proc/self/cgroup", "r", encoding="utf-8") as fh:
+            for line in fh:
+                hierarchy_id, controllers, path = line.rstrip("\n").split(":", 2)
+                if controller:
+                    if controller in controllers.split(","):
+                        return path
+                elif hierarchy_id == "0" and not controllers:
+                    return path
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _cpu_seconds_used() -> float:
+    """
+    CPU seconds consumed so far by this process's cgroup, or by this process.
+    
+    The cgroup is looked up in /proc/self/cgroup, so inside a container the
+    autoscaler sees the usage its quota enforces, and on a host the usage of
+    the process's own slice or scope. A root cgroup is only used when it has
+    a CPU quota (a container's namespaced root); the host's root cgroup would
+    count every process on the machine, so the process CPU time is used instead.
+    """
+    limited = _read_cgroup_cpu_quota() is not None
+
+    # cgroup v2: "usage_usec <n>" in cpu.stat. A container without its own
+    # cgroup namespace sees its cgroup mounted at the root, hence the fallback.
+    relative = _own_cgroup()
+    if relative is not None and (relative != "/" or limited):
+        for directory in (f"/sys/fs/cgroup{relative.rstrip('/')}", "/sys/fs/cgroup"):
+            try:
+                with open(f"{directory}/cpu.stat", "r", encoding="ascii") as fh:
+                    for line in fh:
+                        if line.startswith("usage_usec"):
+                            return int(line.split()[1]) / 1_000_000
+            except (OSError, ValueError, IndexError):
+                continue
+
+    # cgroup v1: cpuacct.usage in nanoseconds
+    relative = _own_cgroup("cpuacct")
+    if relative is not None and (relative != "/" or limited):
+        for base in ("/sys/fs/cgroup/cpuacct", "/sys/fs/cgroup/cpu,cpuacct"):
+            for directory in (f"{base}{relative.rstrip('/')}", base):
+                line = _read_first_line(f"{directory}/cpuacct.usage")
+                if line:
+                    try:
+                        return int(line) / 1_000_000_000
+                    except ValueError:
+                        pass
+    return time.process_time()
+
+
+class WorkerAutoscaler:
+    """
+    Adjusts the number of concurrent conversions at runtime.
+    
+    Starts at CPU-1 (bounded by cgroup limits) and may go up to twice the
+    available CPUs. Throughput is measured over windows that contain at
+    least a few finished files (never over empty wall-clock ticks), so
+    long documents do not produce meaningless 0 pdf/s readings. After each
+    window it shrinks under memory pressure, undoes an increase that did not
+    raise throughput, and otherwise grows while the cgroup of this process
+    has spare CPU and memory. Every further unproductive increase doubles
+    the number of windows it waits before trying to grow again.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        min_workers: int = 1,
+        interval_secs: float = AUTOSCALE_INTERVAL_SECS,
+    ) -> None:
+        self.cpu_limit = detect_cpu_limit()
+        self.max_workers = max(min_workers, max_workers or self.cpu_limit * AUTOSCALE_MAX_FACTOR)
+        self.min_workers = min_workers
+        self.interval_secs = interval_secs
+        self.target = max(min_workers, min(self.max_workers, self.cpu_limit - 1))
+        self._last_time = time.monotonic()
+        self._window_start = self._last_time
+        self._window_cpu = _cpu_seconds_used()
+        self._window_completed = 0
+        self._last_throughput: Optional[float] = None
+        self._last_action: Optional[str] = None
+        self._hold_windows = 0
+        self._unproductive_grows = 0
+        logger.info(
+            f"Autoescalado activo: CPUs disponibles={self.cpu_limit}, "
+            f"workers iniciales={self.target}, máximo={self.max_workers}"
+        )
+
+    def _set_target(self, new_target: int, reason: str) -> None:
+        new_target = max(self.min_workers, min(self.max_workers, new_target))
+        if new_target == self.target:
+            return
+        action = "grow" if new_target > self.target else "shrink"
+        logger.info(f"Autoescalado: workers {self.target} → {new_target} ({reason})")
+        self.target = new_target
+        self._last_action = action
+
+    def _reset_window(self, completed: int) -> None:
+        self._window_start = time.monotonic()
+        self._window_cpu = _cpu_seconds_used()
+        self._window_completed = completed
+
+    def shrink(self, reason: str) -> None:
+        """Reduce concurrency by one worker immediately."""
+        self._set_target(self.target - 1, reason)
+
+    def update(self, completed: int) -> int:
+        """
+        Take a new measurement and adjust the target when a window closes.
+        
+        Memory is checked every ``interval_secs``; throughput and CPU are
+        only evaluated once the current window holds at least
+        ``max(AUTOSCALE_WINDOW_COMPLETIONS, target)`` finished files.
+        
+        Args:
+            completed: Total number of files finished so far
+            
+        Returns:
+            Current target number of concurrent workers
+        """
+        now = time.monotonic()
+        if now - self._last_time < self.interval_secs:
+            return self.target
+        self._last_time = now
+
+        mem_free = free_memory_fraction()
+        if mem_free is not None and mem_free < AUTOSCALE_MEM_LOW:
+            self.shrink(f"memoria libre {mem_free:.0%}")
+            self._reset_window(completed)
+            return self.target
+
+        finished = completed - self._window_completed
+        if finished < max(AUTOSCALE_WINDOW_COMPLETIONS, self.target):
+            return self.target
+
+        elapsed = now - self._window_start
+        throughput = finished / elapsed
+        cpu_util = (_cpu_seconds_used() - self._window_cpu) / (elapsed * self.cpu_limit)
+        self._reset_window(completed)
+
+        logger.debug(
+            f"Autoescalado: {throughput:.2f} pdf/s en {finished} archivos, CPU {cpu_util:.0%}, "
+            f"memoria libre {'?' if mem_free is None else f'{mem_free:.0%}'}, workers {self.target}"
+        )
+
+        previous_throughput = self._last_throughput
+        last_action = self._last_action
+        self._last_action = None
+        self._last_throughput = throughput
+
+        grew = last_action == "grow" and previous_throughput is not None
+        if grew and throughput < previous_throughput * (1 + AUTOSCALE_MIN_GAIN):
+            self.shrink(f"sin mejora: {previous_throughput:.2f} → {throughput:.2f} pdf/s")
+            # Do not try growing again right away; back off further each time
+            # so a saturated batch does not swing between two sizes forever
+            self._unproductive_grows += 1
+            self._hold_windows = min(
+                AUTOSCALE_MAX_HOLD_WINDOWS,
+                AUTOSCALE_HOLD_WINDOWS * 2 ** (self._unproductive_grows - 1),
+            )
+            return self.target
+
+        if grew:
+            self._unproductive_grows = 0
+        if self._hold_windows > 0:
+            self._hold_windows -= 1
+        elif cpu_util < AUTOSCALE_CPU_HIGH and (mem_free is None or mem_free > AUTOSCALE_MEM_GROW):
+            self._set_target(self.target + 1, f"CPU {cpu_util:.0%}, {throughput:.2f} pdf/s")
+        return self.target
+
+
+class SlowConversionSampler:
+    """
+    Sampling stack profiler for a single conversion.
+    
+    Waits ``threshold_secs`` and, if the conversion is still running, samples
+    the stack of the converting thread every few milliseconds until stopped.
+    Stage and page timings are collected by wrapping the pdf2docx Converter
+    steps (see ``instrument``), so the report shows where the time went
+    without having to re-run the document.
+    """
+
+    def __init__(self, pdf_path: Path, threshold_secs: float) -> None:
+        self.pdf_path = pdf_path
+        self.threshold_secs = threshold_secs
+        self.thread_id = threading.get_ident()
+        self.start_time = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.pages: Dict[int, float] = {}
+        self.stacks: Counter = Counter()
+        self.lines: Counter = Counter()
+        self.triggered = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"profiler-{pdf_path.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        if self._stop.wait(self.threshold_secs):
+            return
+        self.triggered = True
+        logger.info(f"{self.pdf_path.name} supera {self.threshold_secs}s; perfilando...")
+        while not self._stop.wait(PROFILE_SAMPLE_INTERVAL_SECS):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.lines[f"{self._label(frame)}:{frame.f_lineno}"] += 1
+            stack = []
+            while frame is not None and len(stack) < PROFILE_MAX_STACK_DEPTH:
+                stack.append(self._label(frame))
+                frame = frame.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+
+    @staticmethod
+    def _label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({Path(code.co_filename).name})"
+
+    def _timed(self, func: Callable, record: Callable[[float], None]) -> Callable:
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(time.perf_counter() - started)
+        return wrapper
+
+    def _add_stage(self, stage: str, secs: float) -> None:
+        # Chunked conversions run each stage several times
+        self.stages[stage] = self.stages.get(stage, 0.0) + secs
+
+    def instrument(self, converter: "Converter") -> None:
+        """Wrap the Converter steps and each page's parse() to record timings."""
+        for stage in ("load_pages", "parse_document", "parse_pages", "make_docx"):
+            method = getattr(converter, stage, None)
+            if method is None:
+                continue
+            setattr(converter, stage, self._timed(method, lambda t, s=stage: self._add_stage(s, t)))
+
+        load_pages = getattr(converter, "load_pages", None)
+        if load_pages is None:
+            return
+
+        def load_pages_and_wrap(*args, **kwargs):
+            result = load_pages(*args, **kwargs)
+            for index, page in enumerate(getattr(converter, "pages", None) or []):
+                page_no = getattr(page, "id", index) + 1
+                page.parse = self._timed(page.parse, lambda t, n=page_no: self.pages.__setitem__(n, t))
+            return result
+
+        converter.load_pages = load_pages_and_wrap
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+    def write_report(self, profile_dir: Path) -> Optional[Path]:
+        """
+        Save the profile of a slow conversion.
+        
+        Writes ``<stem>-<hash>.json`` (total, stage and page timings, hottest lines
+        and functions) and ``<stem>-<hash>.folded`` (collapsed stacks for
+        flamegraph.pl/speedscope). The hash of the full path keeps PDFs with the
+        same name in different folders apart.
+        
+        Args:
+            profile_dir: Directory where the profile files are written
+            
+        Returns:
+            Path of the JSON report, or None if it could not be written
+        """
+        elapsed = time.perf_counter() - self.start_time
+        total_samples = sum(self.stacks.values())
+        cumulative_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            for function in set(stack):
+                cumulative_counts[function] += count
+
+        def top(counter: Counter) -> List[dict]:
+            return [
+                {"function": function, "samples": count, "share": round(count / total_samples, 4)}
+                for function, count in counter.most_common(PROFILE_TOP_FUNCTIONS)
+            ]
+
+        report = {
+            "pdf": str(self.pdf_path),
+            "elapsed_secs": round(elapsed, 3),
+            "threshold_secs": self.threshold_secs,
+            "sample_interval_secs": PROFILE_SAMPLE_INTERVAL_SECS,
+            "samples": total_samples,
+            "stages_secs": {k: round(v, 3) for k, v in self.stages.items()},
+            "pages_secs": {
+                str(page): round(secs, 3)
+                for page, secs in sorted(self.pages.items(), key=lambda item: item[1], reverse=True)
+            },
+            "top_lines": top(self.lines) if total_samples else [],
+            "top_cumulative": top(cumulative_counts) if total_samples else [],
+        }
+        try:
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            digest = hashlib.sha1(str(self.pdf_path.resolve()).encode("utf-8")).hexdigest()[:8]
+            base_name = f"{self.pdf_path.stem}-{digest}"
+            report_path = profile_dir / f"{base_name}.json"
+            with open(report_path, "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2, ensure_ascii=False)
+            with open(profile_dir / f"{base_name}.folded", "w", encoding="utf-8") as fh:
+                for stack, count in self.stacks.most_common():
+                    fh.write(f"{';'.join(stack)} {count}\n")
+        except OSError as exc:
+            logger.warning(f"No se pudo guardar el perfil de {self.pdf_path.name}: {exc}")
+            return None
+        logger.info(f"Perfil de {self.pdf_path.name} ({elapsed:.1f}s) guardado en {report_path}")
+        return report_path
+
+
+def chunk_checkpoint_dir(pdf_path: Path, scratch_dir: Path) -> Path:
+    """
+    Checkpoint directory for one PDF.
+    
+    The name includes a hash of the absolute path, size and modification
+    time, so checkpoints of a file that changed are never reused.
+    
+    Args:
+        pdf_path: PDF being converted
+        scratch_dir: Root directory for checkpoints
+        
+    Returns:
+        Directory holding the page-range checkpoints of this PDF
+    """
+    st = pdf_path.stat()
+    key = f"{pdf_path.resolve()}|{st.st_size}|{st.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return scratch_dir / f"{pdf_path.stem}-{digest}"
+
+
+def remove_checkpoints(pdf_path: Path, scratch_dir: Path, keep: Optional[Path] = None) -> None:
+    """
+    Delete checkpoint directories of a PDF (e.g. older versions of it).
+    
+    Only directories whose source marker points at this exact PDF are
+    removed, so a PDF with the same name in another folder is not affected.
+    
+    Args:
+        pdf_path: PDF whose checkpoints are removed
+        scratch_dir: Root directory for checkpoints
+        keep: Checkpoint directory to leave in place, if any
+    """
+    source = str(pdf_path.resolve())
+    for candidate in scratch_dir.glob(f"{glob.escape(pdf_path.stem)}-*"):
+        if candidate == keep or not candidate.is_dir():
+            continue
+        marker = _read_first_line(str(candidate / CHECKPOINT_SOURCE_FILE))
+        if marker == source:
+            logger.debug(f"Eliminando checkpoints obsoletos: {candidate}")
+            shutil.rmtree(candidate, ignore_errors=True)
+
+
+# pdf2docx versions whose Pages.parse() was checked to scan fonts only through
+# Fonts.extract(); the font scan cache is not used with any other version
+FONT_SCAN_CACHE_VERSIONS = frozenset({"0.5.8"})
+
+# Per-thread cache used while a chunked conversion runs (see _reuse_font_scan)
+_font_scan_cache = threading.local()
+_font_scan_lock = threading.Lock()
+_font_scan_users = 0
+_original_fonts_cls = None
+
+
+def _installed_version(distribution: str) -> Optional[str]:
+    """Version of an installed distribution, or None if it cannot be determined."""
+    try:
+        from importlib.metadata import version
+        return version(distribution)
+    except Exception:
+        return None
+
+
+def _install_font_scan_cache() -> bool:
+    """
+    Let pdf2docx reuse one font scan per document.
+    
+    pdf2docx scans the fonts of the *whole* document in every
+    parse_document() call, i.e. once per chunk. This swaps the ``Fonts``
+    class seen by ``pdf2docx.page.Pages`` for a subclass whose extract()
+    returns a cached result for documents registered by the current thread
+    and behaves exactly like the original otherwise. The swap is reference
+    counted: _uninstall_font_scan_cache() restores the original class once
+    no chunked conversion needs it.
+    
+    Returns:
+        True if the cache was installed for this pdf2docx version
+    """
+    global _font_scan_users, _original_fonts_cls
+    if _installed_version("pdf2docx") not in FONT_SCAN_CACHE_VERSIONS:
+        return False
+    try:
+        pages_module = importlib.import_module("pdf2docx.page.Pages")
+    except ImportError:
+        return False
+
+    with _font_scan_lock:
+        if _font_scan_users == 0:
+            fonts_cls = getattr(pages_module, "Fonts", None)
+            if fonts_cls is None or not hasattr(fonts_cls, "extract"):
+                return False
+            original_extract = fonts_cls.extract
+
+            class CachedFonts(fonts_cls):
+
+                @classmethod
+                def extract(cls, fitz_doc):
+                    cache = getattr(_font_scan_cache, "docs", None)
+                    if cache is None or id(fitz_doc) not in cache:
+                        return original_extract(fitz_doc)
+                    if cache[id(fitz_doc)] is None:
+                        cache[id(fitz_doc)] = original_extract(fitz_doc)
+                    return cache[id(fitz_doc)]
+
+            _original_fonts_cls = fonts_cls
+            pages_module.Fonts = CachedFonts
+        _font_scan_users += 1
+    return True
+
+
+def _uninstall_font_scan_cache() -> None:
+    """Undo one _install_font_scan_cache(); the last one restores pdf2docx."""
+    global _font_scan_users, _original_fonts_cls
+    pages_module = importlib.import_module("pdf2docx.page.Pages")
+    with _font_scan_lock:
+        _font_scan_users -= 1
+        if _font_scan_users == 0:
+            pages_module.Fonts = _original_fonts_cls
+            _original_fonts_cls = None
+
+
+@contextmanager
+def _reuse_font_scan(fitz_doc):
+    """Scan the fonts of ``fitz_doc`` only once while the block runs."""
+    if not _install_font_scan_cache():
+        logger.debug("pdf2docx no permite reutilizar el análisis de fuentes; se repetirá por bloque")
+        yield
+        return
+    _font_scan_cache.docs = {id(fitz_doc): None}
+    try:
+        yield
+    finally:
+        _font_scan_cache.docs = None
+        _uninstall_font_scan_cache()
+
+
+def convert_in_chunks(
+    converter: "Converter",
+    pdf_path: Path,
+    docx_path: Path,
+    chunk_pages: int,
+    checkpoint_dir: Path,
+) -> None:
+    """
+    Convert a PDF in page ranges, persisting each parsed range.
+    
+    Each range is parsed and written with ``Converter.serialize`` to
+    ``checkpoint_dir``. Ranges that already have a checkpoint are not parsed
+    again: that covers a retry after a transient error in the same run, and
+    a later run after a timeout, a crash or a killed process. Finally all
+    ranges are restored and written to a single DOCX, and the checkpoints
+    removed.
+    
+    With the pdf2docx versions in FONT_SCAN_CACHE_VERSIONS the document-wide
+    font scan runs once, not once per range. pdf2docx (0.5.x) has no
+    cross-page header/footer detection yet, so the other document-level
+    analysis is per page and chunking does not change the output.
+    
+    Args:
+        converter: Open pdf2docx Converter for pdf_path
+        pdf_path: PDF being converted
+        docx_path: Destination DOCX file
+        chunk_pages: Number of pages per range
+        checkpoint_dir: Directory for this PDF's checkpoints
+    """
+    settings = converter.default_settings
+    num_pages = len(converter.fitz_doc)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    (checkpoint_dir / CHECKPOINT_SOURCE_FILE).write_text(str(pdf_path.resolve()), encoding="utf-8")
+    # Checkpoints of previous versions of this PDF can never be reused
+    remove_checkpoints(pdf_path, checkpoint_dir.parent, keep=checkpoint_dir)
+
+    chunk_files = []
+    with _reuse_font_scan(converter.fitz_doc):
+        for start in range(0, num_pages, chunk_pages):
+            end = min(start + chunk_pages, num_pages)
+            chunk_file = checkpoint_dir / f"pages_{start + 1:05d}-{end:05d}.json"
+            chunk_files.append(chunk_file)
+            if chunk_file.exists():
+                logger.debug(f"{pdf_path.name}: páginas {start + 1}-{end} ya convertidas (checkpoint)")
+                continue
+            logger.info(f"{pdf_path.name}: convirtiendo páginas {start + 1}-{end} de {num_pages}")
+            converter.parse(start=start, end=end, **settings)
+            tmp_file = chunk_file.with_name(chunk_file.name + ".tmp")
+            converter.serialize(str(tmp_file))
+            os.replace(tmp_file, chunk_file)
+
+    # Merge: restore every parsed range and build one DOCX
+    converter.load_pages(0, None, None)
+    for chunk_file in chunk_files:
+        converter.deserialize(str(chunk_file))
+    converter.make_docx(str(docx_path), **settings)
+
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
+
+
+class OutputClaim:
+    """
+    Cross-process claim on one output DOCX.
+    
+    The claim is a ``<name>.docx.lock`` file created with O_CREAT | O_EXCL, so
+    only one process (on this host or on a shared filesystem) converts a given
+    PDF at a time. While the claim is held its mtime is refreshed periodically;
+    a lock that has not been refreshed for ``stale_secs``, or whose owner
+    process on this host is gone, is considered abandoned and taken over.
+    
+    Only one claimant may take over a given stale lock: the one that creates
+    a marker named after that lock file's identity (inode and mtime). The
+    lock path is therefore never moved by a claimant whose view of it is out
+    of date. As leases can still be lost (e.g. by a process suspended for
+    longer than ``stale_secs``), owners call held() before publishing.
+    """
+
+    def __init__(self, docx_path: Path, stale_secs: float = CLAIM_STALE_SECS) -> None:
+        self.path = docx_path.with_name(docx_path.name + CLAIM_SUFFIX)
+        self.stale_secs = stale_secs
+        # The random token tells apart claims made by the same thread
+        self.owner = f"{socket.gethostname()} {os.getpid()} {threading.get_ident()} {os.urandom(4).hex()}"
+        self._inode: Optional[int] = None
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def _create(self, path: Optional[Path] = None) -> Optional[int]:
+        """Create ``path`` (default: the lock) exclusively; return its inode or None."""
+        try:
+            fd = os.open(str(path or self.path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return None
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(f"{self.owner} {time.time()}\n")
+            return os.fstat(fh.fileno()).st_ino
+
+    def _read_owner(self, path: Optional[Path] = None) -> Optional[str]:
+        try:
+            with open(path or self.path, "r", encoding="utf-8") as fh:
+                return fh.readline().strip()
+        except OSError:
+            return None
+
+    def _is_owned_by(self, owner: Optional[str]) -> bool:
+        return owner is not None and owner.split()[:4] == self.owner.split()
+
+    def _is_stale(self, owner: str, mtime: float) -> bool:
+        if time.time() - mtime > self.stale_secs:
+            return True
+        # Same host: a lock left by a process that no longer exists is stale.
+        # (os.kill(pid, 0) only probes on POSIX; on Windows it would kill.)
+        parts = owner.split()
+        if os.name == "posix" and len(parts) >= 2 and parts[0] == socket.gethostname():
+            try:
+                os.kill(int(parts[1]), 0)
+            except ProcessLookupError:
+                return True
+            except (PermissionError, ValueError):
+                return False
+        return False
+
+    def held(self) -> bool:
+        """True while the lock file is still the one this claim created."""
+        if self._inode is None:
+            return False
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return st.st_ino == self._inode and self._is_owned_by(self._read_owner())
+
+    def acquire(self) -> bool:
+        """
+        Try to claim the output.
+        
+        Returns:
+            True if this process now owns the claim, False if another live
+            process is converting the same file
+        """
+        if self._claim():
+            return True
+
+        try:
+            stale = os.stat(self.path)
+        except FileNotFoundError:
+            # Released meanwhile
+            return self._claim()
+        owner = self._read_owner()
+        if owner is None or not self._is_stale(owner, stale.st_mtime):
+            return False
+
+        # Elect the single claimant allowed to take over this particular lock file
+        marker = self.path.with_name(f"{self.path.name}.takeover.{stale.st_ino}.{stale.st_mtime_ns}")
+        if self._create(marker) is None:
+            try:
+                # Left behind by a claimant that died mid-takeover: clear it for the next attempt
+                if time.time() - marker.stat().st_mtime > self.stale_secs:
+                    marker.unlink()
+            except OSError:
+                pass
+            return False
+        try:
+            return self._take_over(stale, owner)
+        finally:
+            marker.unlink(missing_ok=True)
+
+    def _take_over(self, stale: os.stat_result, owner: str) -> bool:
+        # The lock may have been taken over (and the marker removed) before we
+        # won the election, or released and claimed again: then it is not ours to move
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return self._claim()
+        if (current.st_ino, current.st_mtime_ns) != (stale.st_ino, stale.st_mtime_ns):
+            return False
+
+        tombstone = self.path.with_name(f"{self.path.name}.stale.{self.owner.replace(' ', '.')}")
+        try:
+            os.rename(self.path, tombstone)
+        except OSError:
+            return False
+        moved = os.stat(tombstone)
+        if (moved.st_ino, moved.st_mtime_ns) != (stale.st_ino, stale.st_mtime_ns):
+            # Its owner released it and someone claimed it again in between:
+            # put that lock back (link fails if yet another one appeared; that
+            # owner then fails held() and does not publish)
+            try:
+                os.link(tombstone, self.path)
+            except OSError:
+                pass
+            tombstone.unlink(missing_ok=True)
+            return False
+
+        tombstone.unlink(missing_ok=True)
+        logger.warning(f"Bloqueo abandonado en {self.path.name} ({owner}); se reutiliza")
+        return self._claim()
+
+    def _claim(self) -> bool:
+        inode = self._create()
+        if inode is None:
+            return False
+        self._inode = inode
+        self._start_heartbeat()
+        return True
+
+    def _start_heartbeat(self) -> None:
+        def beat() -> None:
+            while not self._stop.wait(self.stale_secs / 4):
+                if not self.held():
+                    logger.warning(f"Se perdió el bloqueo {self.path.name}: otro proceso lo tomó")
+                    return
+                try:
+                    os.utime(self.path)
+                except OSError:
+                    pass
+
+        self._heartbeat = threading.Thread(target=beat, name=f"claim-{self.path.name}", daemon=True)
+        self._heartbeat.start()
+
+    def release(self) -> None:
+        """Give up the claim and remove the lock file, if it is still ours."""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        if self.held():
+            try:
+                self.path.unlink()
+            except OSError as exc:
+                logger.warning(f"No se pudo eliminar el bloqueo {self.path}: {exc}")
+        self._inode = None
+
+
+def convert_single(
+    pdf_path: Path,
+    output_dir: Path,
+    overwrite: bool,
+    profile_slow_secs: Optional[float] = None,
+    profile_dir: Optional[Path] = None,
+    chunk_pages: Optional[int] = None,
+    scratch_dir: Optional[Path] = None,
+    claim_stale_secs: Optional[float] = CLAIM_STALE_SECS,
+) -> Result:
     """
     Convert a single PDF file to DOCX format.
     
@@ -129,12 +1146,23 @@ def convert_single(pdf_path: Path, output_dir: Path, overwrite: bool) -> Result:
         pdf_path: Path to the PDF file to convert
         output_dir: Directory where the DOCX file will be saved
         overwrite: Whether to overwrite existing DOCX files
+        profile_slow_secs: If set, conversions slower than this are profiled
+        profile_dir: Where slow-conversion profiles are saved (default: output_dir/.pdf2docx_profiles)
+        chunk_pages: If set, PDFs with more pages are converted in resumable page ranges
+        scratch_dir: Where page-range checkpoints are kept (default: output_dir/.pdf2docx_chunks)
+        claim_stale_secs: Expiry of other processes' claims on the same DOCX (None disables claims)
         
     Returns:
-        Tuple of (status, pdf_path, error_message)
+        Tuple of (status, pdf_path, error_message, error_code)
         status can be: "ok", "skipped", or "error"
+        error_code is one of the ERR_* constants, or "" when there is no error
     """
+    from pdf2docx import Converter
+
     converter = None
+    sampler: Optional[SlowConversionSampler] = None
+    claim: Optional[OutputClaim] = None
+    part_path: Optional[Path] = None
     try:
         # Create output directory if it doesn't exist
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -143,43 +1171,80 @@ def convert_single(pdf_path: Path, output_dir: Path, overwrite: bool) -> Result:
         # Check if file already exists
         if docx_path.exists() and not overwrite:
             logger.info(f"Saltando {pdf_path.name} - ya existe")
-            return "skipped", pdf_path, "DOCX ya existe"
+            return "skipped", pdf_path, "DOCX ya existe", ""
         
         # Validate input file
         if not pdf_path.exists():
             error_msg = "El archivo PDF no existe"
             logger.error(f"Error en {pdf_path.name}: {error_msg}")
-            return "error", pdf_path, error_msg
+            return "error", pdf_path, error_msg, ERR_NOT_FOUND
             
         if pdf_path.stat().st_size == 0:
             error_msg = "El archivo PDF está vacío"
             logger.error(f"Error en {pdf_path.name}: {error_msg}")
-            return "error", pdf_path, error_msg
+            return "error", pdf_path, error_msg, ERR_EMPTY
         
+        # Claim the output so concurrent runs sharing output_dir convert it only once
+        if claim_stale_secs is not None:
+            claim = OutputClaim(docx_path, claim_stale_secs)
+            if not claim.acquire():
+                claim = None
+                logger.info(f"Saltando {pdf_path.name} - otro proceso lo está convirtiendo")
+                return "skipped", pdf_path, "En conversión por otro proceso", ""
+            # Another run may have finished it between the check above and the claim
+            if docx_path.exists() and not overwrite:
+                logger.info(f"Saltando {pdf_path.name} - ya existe")
+                return "skipped", pdf_path, "DOCX ya existe", ""
+
         # Convert with proper cleanup using try/finally
         logger.debug(f"Convirtiendo {pdf_path.name}...")
+        # Unique per claimant, so overlapping runs never write, publish or delete each other's file
+        part_path = docx_path.with_name(f"{docx_path.name}.part.{os.getpid()}.{threading.get_ident()}")
+        if profile_slow_secs is not None:
+            sampler = SlowConversionSampler(pdf_path, profile_slow_secs)
         converter = Converter(str(pdf_path))
-        converter.convert(str(docx_path), start=0, end=None)
+        if sampler is not None:
+            sampler.instrument(converter)
+        if chunk_pages is not None and 0 < chunk_pages < len(converter.fitz_doc):
+            checkpoint_dir = chunk_checkpoint_dir(pdf_path, scratch_dir or output_dir / CHUNKS_DIRNAME)
+            convert_in_chunks(converter, pdf_path, part_path, chunk_pages, checkpoint_dir)
+        else:
+            converter.convert(str(part_path), start=0, end=None)
+        # Publish atomically: a DOCX that exists is always complete. A claim
+        # that was lost meanwhile (taken over by another run) must not publish.
+        if claim is not None and not claim.held():
+            logger.warning(f"Descartando {pdf_path.name} - otro proceso tomó su bloqueo")
+            return "skipped", pdf_path, "En conversión por otro proceso", ""
+        os.replace(part_path, docx_path)
         
         logger.info(f"✓ Convertido: {pdf_path.name}")
-        return "ok", pdf_path, ""
-        
-    except MemoryError as exc:
-        error_msg = "Memoria insuficiente para procesar este archivo"
-        logger.error(f"Error de memoria en {pdf_path.name}: {error_msg}")
-        return "error", pdf_path, error_msg
-        
-    except PermissionError as exc:
-        error_msg = f"Sin permisos para acceder al archivo: {str(exc)}"
-        logger.error(f"Error de permisos en {pdf_path.name}: {error_msg}")
-        return "error", pdf_path, error_msg
+        return "ok", pdf_path, "", ""
         
     except Exception as exc:
-        error_msg = f"{type(exc).__name__}: {str(exc)}"
-        logger.error(f"Error en {pdf_path.name}: {error_msg}")
-        return "error", pdf_path, error_msg
+        code = classify_error(exc)
+        if code == ERR_MEMORY:
+            error_msg = "Memoria insuficiente para procesar este archivo"
+            logger.error(f"Error de memoria en {pdf_path.name}: {error_msg}")
+        elif code == ERR_PERMISSION:
+            error_msg = f"Sin permisos para acceder al archivo: {str(exc)}"
+            logger.error(f"Error de permisos en {pdf_path.name}: {error_msg}")
+        elif code == ERR_IO:
+            error_msg = f"Error de E/S: {str(exc)}"
+            logger.error(f"Error de E/S en {pdf_path.name}: {error_msg}")
+        elif code == ERR_CONVERSION:
+            error_msg = f"{type(exc).__name__}: {str(exc)}"
+            logger.error(f"Error en {pdf_path.name}: {error_msg}")
+        else:
+            error_msg = f"{type(exc).__name__}: {str(exc)}"
+            logger.error(f"Error inesperado en {pdf_path.name}: {error_msg}")
+        return "error", pdf_path, error_msg, code
         
     finally:
+        if sampler is not None:
+            sampler.stop()
+            if sampler.triggered:
+                sampler.write_report(profile_dir or output_dir / PROFILE_DIRNAME)
+
         # Ensure converter is always closed to prevent hanging
         if converter is not None:
             try:
@@ -187,31 +1252,422 @@ def convert_single(pdf_path: Path, output_dir: Path, overwrite: bool) -> Result:
             except Exception as e:
                 logger.warning(f"Error al cerrar converter para {pdf_path.name}: {e}")
 
+        # Never leave a half-written DOCX behind
+        if part_path is not None and part_path.exists():
+            try:
+                part_path.unlink()
+            except OSError as e:
+                logger.warning(f"No se pudo eliminar {part_path.name}: {e}")
+
+        if claim is not None:
+            claim.release()
+
+
+def classify_error(exc: BaseException) -> str:
+    """
+    Map an exception raised while converting to one of the ERR_* codes.
+    
+    pdf2docx re-raises per-page failures as ConversionException and MuPDF
+    reports allocation failures as RuntimeError, so the whole chain of
+    causes (``__cause__``/``__context__``) is inspected, not only the
+    outermost exception. Only failures known to come from parsing the PDF
+    are ERR_CONVERSION; anything unrecognised is ERR_UNKNOWN.
+    
+    Args:
+        exc: Exception raised by the conversion
+        
+    Returns:
+        Error code
+    """
+    chain: List[BaseException] = []
+    current: Optional[BaseException] = exc
+    while current is not None and all(current is not seen for seen in chain):
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+
+    for error in chain:
+        if isinstance(error, MemoryError):
+            return ERR_MEMORY
+        message = str(error).lower()
+        if any(marker in message for marker in MEMORY_ERROR_MARKERS):
+            return ERR_MEMORY
+    for error in chain:
+        if isinstance(error, PermissionError):
+            return ERR_PERMISSION
+        if isinstance(error, OSError):
+            return ERR_IO
+    if any(type(error).__name__ in PARSE_ERROR_NAMES for error in chain):
+        return ERR_CONVERSION
+    return ERR_UNKNOWN
+
+
+class Quarantine:
+    """
+    Persistent list of PDFs that fail deterministically.
+    
+    Entries are keyed by absolute path and remember the file size and
+    modification time, so a quarantined PDF is skipped on future runs
+    until the file changes. Timeouts are counted per file version and
+    the file is quarantined once it reaches the configured limit.
+    Changes are written immediately, so a run that is killed keeps them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: Dict[str, dict] = self._load()
+        # Changes made by this run, merged into the file on save()
+        self._added: Dict[str, dict] = {}
+        self._removed: set = set()
+        if self.entries:
+            logger.info(f"Cuarentena cargada: {len(self.entries)} archivo(s) en {path}")
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning(f"No se pudo leer la cuarentena {self.path}: {exc}; se ignora")
+            return {}
+
+    @staticmethod
+    def _key(pdf_path: Path) -> str:
+        return str(pdf_path.resolve())
+
+    @staticmethod
+    def _fingerprint(pdf_path: Path) -> Optional[Tuple[int, float]]:
+        try:
+            st = pdf_path.stat()
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime
+
+    def contains(self, pdf_path: Path) -> bool:
+        """True if the file is quarantined and has not changed since."""
+        entry = self.entries.get(self._key(pdf_path))
+        if entry is None:
+            return False
+        fingerprint = self._fingerprint(pdf_path)
+        if fingerprint is None or fingerprint != (entry.get("size"), entry.get("mtime")):
+            # File changed (or vanished): give it another chance
+            self._forget(self._key(pdf_path))
+            return False
+        # Entries counting timeouts only quarantine once the limit is reached
+        return entry.get("quarantined", True)
+
+    def reason(self, pdf_path: Path) -> str:
+        """Error message recorded when the file was quarantined."""
+        return self.entries.get(self._key(pdf_path), {}).get("error", "")
+
+    def _put(self, pdf_path: Path, entry: dict) -> bool:
+        fingerprint = self._fingerprint(pdf_path)
+        if fingerprint is None:
+            return False
+        key = self._key(pdf_path)
+        entry.update(size=fingerprint[0], mtime=fingerprint[1], time=time.time())
+        self.entries[key] = self._added[key] = entry
+        self._removed.discard(key)
+        return True
+
+    def _forget(self, key: str) -> None:
+        if self.entries.pop(key, None) is not None:
+            self._removed.add(key)
+        self._added.pop(key, None)
+
+    def add(self, pdf_path: Path, code: str, error_msg: str) -> None:
+        """Quarantine a file after a deterministic failure."""
+        if self._put(pdf_path, {"code": code, "error": error_msg, "quarantined": True}):
+            logger.warning(f"En cuarentena: {pdf_path.name} ({code})")
+            self.save()
+
+    def record_timeout(self, pdf_path: Path, error_msg: str, limit: int) -> bool:
+        """
+        Count a timeout for the current version of a file.
+        
+        Args:
+            pdf_path: PDF that timed out
+            error_msg: Timeout message to record
+            limit: Timeouts after which the file is quarantined (0 never quarantines)
+            
+        Returns:
+            True if the file is now quarantined
+        """
+        if limit <= 0:
+            return False
+        entry = self.entries.get(self._key(pdf_path))
+        previous = 0
+        if entry is not None and (entry.get("size"), entry.get("mtime")) == self._fingerprint(pdf_path):
+            previous = entry.get("timeouts", 0)
+        timeouts = previous + 1
+        quarantined = timeouts >= limit
+        if not self._put(pdf_path, {
+            "code": ERR_TIMEOUT,
+            "error": error_msg,
+            "timeouts": timeouts,
+            "quarantined": quarantined,
+        }):
+            return False
+        if quarantined:
+            logger.warning(f"En cuarentena: {pdf_path.name} ({ERR_TIMEOUT}, {timeouts} veces)")
+        self.save()
+        return quarantined
+
+    def discard(self, pdf_path: Path) -> None:
+        """Remove a file from quarantine (and its timeout count), if present."""
+        key = self._key(pdf_path)
+        if key in self.entries:
+            self._forget(key)
+            self.save()
+
+    def save(self) -> None:
+        """
+        Write this run's changes to the quarantine file.
+        
+        The file is re-read first so entries added by other runs sharing the
+        same output directory are kept.
+        """
+        if not self._added and not self._removed:
+            return
+        entries = self._load()
+        for key in self._removed:
+            entries.pop(key, None)
+        entries.update(self._added)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(entries, fh, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.warning(f"No se pudo guardar la cuarentena {self.path}: {exc}")
+            return
+        self.entries = entries
+        self._added.clear()
+        self._removed.clear()
+
+
+class LaneScheduler:
+    """
+    Chooses which queued PDF to start next when a worker slot frees up.
+    
+    Files are split into a fast lane (small files or explicit priority) and a
+    bulk lane. While both lanes have work, the fast lane is guaranteed a share
+    of the workers and the bulk lane keeps the rest; when one lane is empty
+    the other may use (steal) all of the slots.
+    """
+
+    def __init__(
+        self,
+        files: List[Path],
+        fast_lane_max_bytes: Optional[int] = None,
+        fast_lane_share: float = FAST_LANE_SHARE,
+        priority_files: Optional[Iterable[Path]] = None,
+    ) -> None:
+        self.fast_lane_share = min(1.0, max(0.0, fast_lane_share))
+        self.queues: Dict[str, Deque[Path]] = {LANE_FAST: deque(), LANE_BULK: deque()}
+        self.in_flight: Counter = Counter()
+        priority = {p.resolve() for p in priority_files or ()}
+        for pdf_path in files:
+            self.queues[self._classify(pdf_path, fast_lane_max_bytes, priority)].append(pdf_path)
+        if fast_lane_max_bytes is not None or priority:
+            logger.info(
+                f"Carriles: rápido={len(self.queues[LANE_FAST])}, "
+                f"masivo={len(self.queues[LANE_BULK])}"
+            )
+
+    @staticmethod
+    def _classify(pdf_path: Path, fast_lane_max_bytes: Optional[int], priority: set) -> str:
+        if priority and pdf_path.resolve() in priority:
+            return LANE_FAST
+        if fast_lane_max_bytes is None:
+            return LANE_BULK
+        try:
+            size = pdf_path.stat().st_size
+        except OSError:
+            # Missing/unreadable files fail immediately; do not let them wait
+            return LANE_FAST
+        return LANE_FAST if size <= fast_lane_max_bytes else LANE_BULK
+
+    def __bool__(self) -> bool:
+        return any(self.queues.values())
+
+    def reserved(self, limit: int) -> int:
+        """Number of slots reserved for the fast lane out of ``limit``."""
+        if self.fast_lane_share <= 0:
+            return 0
+        reserved = max(1, round(limit * self.fast_lane_share))
+        return min(reserved, limit - 1) if limit > 1 else reserved
+
+    def next(self, limit: int) -> Optional[Tuple[str, Path]]:
+        """
+        Pop the next file to run, or None if no lane may start one now.
+        
+        Args:
+            limit: Current total number of concurrent workers
+            
+        Returns:
+            Tuple of (lane, pdf_path) or None
+        """
+        if sum(self.in_flight.values()) >= limit:
+            return None
+        fast_q, bulk_q = self.queues[LANE_FAST], self.queues[LANE_BULK]
+        bulk_slots = limit - self.reserved(limit)
+
+        if fast_q and (
+            not bulk_q
+            or self.in_flight[LANE_FAST] < self.reserved(limit)
+            or self.in_flight[LANE_BULK] >= bulk_slots
+        ):
+            lane = LANE_FAST
+        elif bulk_q and (not fast_q or self.in_flight[LANE_BULK] < bulk_slots):
+            lane = LANE_BULK
+        else:
+            return None
+
+        self.in_flight[lane] += 1
+        return lane, self.queues[lane].popleft()
+
+    def push_front(self, lane: str, pdf_path: Path) -> None:
+        """Put a file back at the head of its lane (used for retries)."""
+        self.queues[lane].appendleft(pdf_path)
+
+    def release(self, lane: str) -> None:
+        """Mark a file of ``lane`` as no longer running."""
+        self.in_flight[lane] -= 1
+
+
+def _mark_started(start_times: Dict[Path, float], pdf_path: Path, *args, **kwargs) -> Result:
+    """Run convert_single in a worker thread, recording when it really started."""
+    start_times[pdf_path] = time.time()
+    return convert_single(pdf_path, *args, **kwargs)
+
+
+def resolve_quarantine_file(
+    output_dir: Path,
+    quarantine_file: Optional[Union[str, Path]] = None,
+    enabled: bool = True,
+) -> Optional[Path]:
+    """
+    Resolve where the quarantine list lives.
+    
+    Args:
+        output_dir: Output directory of the run
+        quarantine_file: Explicit path, or None for the default inside output_dir
+        enabled: Whether quarantine is enabled at all
+        
+    Returns:
+        Path of the quarantine file, or None if disabled
+    """
+    if not enabled:
+        return None
+    if quarantine_file:
+        return Path(quarantine_file)
+    return output_dir / QUARANTINE_FILENAME
+
+
+def plan_batch(
+    pdf_files: Iterable[Path],
+    output_dir: Path,
+    overwrite: bool,
+    quarantine_file: Optional[Path] = None,
+) -> List[Tuple[str, Path, str]]:
+    """
+    Pre-flight check: decide what a batch would do without converting anything.
+    
+    Does not import pdf2docx and does not create the output directory.
+    
+    Args:
+        pdf_files: PDF files to check
+        output_dir: Directory where DOCX files would be saved
+        overwrite: Whether existing DOCX files would be overwritten
+        quarantine_file: Quarantine JSON to honour (None ignores quarantine)
+        
+    Returns:
+        List of (action, pdf_path, detail) with action one of
+        "convert", "skipped", "quarantined" or "error"
+    """
+    quarantine = Quarantine(quarantine_file) if quarantine_file is not None else None
+    plan: List[Tuple[str, Path, str]] = []
+    # Same order of checks as process_batch + convert_single
+    for pdf_path in pdf_files:
+        if quarantine is not None and quarantine.contains(pdf_path):
+            plan.append(("quarantined", pdf_path, quarantine.reason(pdf_path)))
+            continue
+        if (output_dir / f"{pdf_path.stem}.docx").exists() and not overwrite:
+            plan.append(("skipped", pdf_path, "DOCX ya existe"))
+            continue
+        try:
+            size = pdf_path.stat().st_size
+        except OSError:
+            plan.append(("error", pdf_path, "El archivo PDF no existe"))
+            continue
+        if size == 0:
+            plan.append(("error", pdf_path, "El archivo PDF está vacío"))
+        else:
+            plan.append(("convert", pdf_path, f"{size / (1024 * 1024):.1f} MB"))
+    return plan
+
 
 def process_batch(
     pdf_files: Iterable[Path],
     output_dir: Path,
-    workers: int,
+    workers: Union[int, str],
     overwrite: bool,
     timeout_secs: Optional[float] = None,
     progress_cb: Optional[Callable[[int, int], None]] = None,
+    fast_lane_max_mb: Optional[float] = FAST_LANE_MAX_MB,
+    fast_lane_share: float = FAST_LANE_SHARE,
+    priority_files: Optional[Iterable[Path]] = None,
+    retries: int = DEFAULT_RETRIES,
+    retry_backoff_secs: float = DEFAULT_RETRY_BACKOFF_SECS,
+    quarantine_file: Optional[Union[str, Path]] = None,
+    use_quarantine: bool = True,
+    quarantine_after_timeouts: int = QUARANTINE_AFTER_TIMEOUTS,
+    profile_slow_secs: Optional[float] = None,
+    profile_dir: Optional[Path] = None,
+    chunk_pages: Optional[int] = None,
+    scratch_dir: Optional[Path] = None,
+    claim_stale_secs: Optional[float] = CLAIM_STALE_SECS,
 ) -> Tuple[Counter, List[Tuple[Path, str]]]:
     """
     Process a batch of PDF files in parallel.
     
+    Files are submitted incrementally so the number of concurrent
+    conversions can change while the batch runs (see ``workers="auto"``).
+    Small files are scheduled on a fast lane so they are not stuck behind
+    huge documents (see ``LaneScheduler``). Transient failures are retried
+    with exponential backoff; deterministic failures are quarantined.
+    
     Args:
         pdf_files: Iterable of PDF file paths to convert
         output_dir: Directory where DOCX files will be saved
-        workers: Number of concurrent workers
+        workers: Number of concurrent workers, or "auto" to autoscale
         overwrite: Whether to overwrite existing DOCX files
         timeout_secs: Optional timeout in seconds for each file
         progress_cb: Optional callback function to report progress
+        fast_lane_max_mb: Files up to this size go to the fast lane (None or 0 disables it)
+        fast_lane_share: Fraction of workers reserved for the fast lane
+        priority_files: Files that always go to the fast lane, regardless of size
+        retries: Maximum retries per file for TRANSIENT_ERRORS (default: 2)
+        retry_backoff_secs: Delay before the first retry; doubled on each attempt
+        quarantine_file: JSON file listing PDFs to skip until they change
+            (default: <output_dir>/.pdf2docx_quarantine.json)
+        use_quarantine: Whether to skip and record deterministically failing PDFs
+        quarantine_after_timeouts: Quarantine a PDF after this many timeouts (0 never does)
+        profile_slow_secs: Profile conversions that take longer than this many seconds
+        profile_dir: Where slow-conversion profiles are saved
+        chunk_pages: Convert PDFs with more pages in resumable ranges of this size
+        scratch_dir: Where page-range checkpoints are kept
+        claim_stale_secs: Expiry of other processes' claims on an output (None disables claims)
         
     Returns:
         Tuple of (counts, errors) where:
-        - counts: Counter with status counts (ok, skipped, error)
+        - counts: Counter with status counts (ok, skipped, quarantined, error)
         - errors: List of (path, error_message) tuples for failed conversions
     """
+    from tqdm import tqdm
+
     counts: Counter = Counter()
     errors: List[Tuple[Path, str]] = []
     files_list = pdf_files if isinstance(pdf_files, list) else list(pdf_files)
@@ -221,95 +1677,192 @@ def process_batch(
         logger.warning("No hay archivos para procesar")
         return counts, errors
 
-    logger.info(f"Iniciando conversión de {total} archivos con {workers} workers...")
+    autoscaler: Optional[WorkerAutoscaler] = None
+    if workers == AUTO_WORKERS:
+        autoscaler = WorkerAutoscaler()
+        pool_size = autoscaler.max_workers
+        logger.info(f"Iniciando conversión de {total} archivos con workers automáticos...")
+    else:
+        pool_size = max(1, int(workers))
+        logger.info(f"Iniciando conversión de {total} archivos con {pool_size} workers...")
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-        future_map = {
-            executor.submit(convert_single, pdf_path, output_dir, overwrite): pdf_path
-            for pdf_path in files_list
-        }
+    # Calculate check interval: min of 5 seconds or half the timeout
+    check_interval: Optional[float] = None
+    if timeout_secs:
+        check_interval = min(timeout_secs / 2, 5.0)
+    if autoscaler is not None:
+        check_interval = min(check_interval or autoscaler.interval_secs, autoscaler.interval_secs)
+
+    # Files quarantined by previous runs are skipped until they change
+    quarantine_path = resolve_quarantine_file(output_dir, quarantine_file, use_quarantine)
+    quarantine = Quarantine(quarantine_path) if quarantine_path is not None else None
+    quarantined: List[Path] = []
+    if quarantine is not None:
+        quarantined = [p for p in files_list if quarantine.contains(p)]
+    skip = set(quarantined)
+    to_convert = [p for p in files_list if p not in skip] if skip else files_list
+
+    fast_lane_max_bytes = int(fast_lane_max_mb * 1024 * 1024) if fast_lane_max_mb else None
+    queued = LaneScheduler(to_convert, fast_lane_max_bytes, fast_lane_share, priority_files)
+    future_map: dict = {}
+    lane_map: dict = {}
+    # Set by the worker thread when a conversion actually begins, so time spent
+    # waiting for a free thread (e.g. behind a timed-out one) is not counted
+    start_times: Dict[Path, float] = {}
+    attempts: Counter = Counter()
+    retry_waiting: List[Tuple[float, str, Path]] = []
+    # Timed-out conversions keep running; their late outcome is still checked
+    timed_out: Dict[concurrent.futures.Future, Path] = {}
+    memory_cap = pool_size
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=pool_size) as executor, \
+            tqdm(total=total, desc="Convirtiendo", unit="pdf") as pbar:
+
+        def discard_checkpoints(pdf_path_res: Path) -> None:
+            # A known parse failure repeats on every attempt; its checkpoints are useless
+            if chunk_pages:
+                remove_checkpoints(pdf_path_res, scratch_dir or output_dir / CHUNKS_DIRNAME)
 
-        if timeout_secs is None:
-            # Process without timeout
-            for future in tqdm(
-                concurrent.futures.as_completed(future_map),
-                total=len(future_map),
-                desc="Convirtiendo",
-                unit="pdf",
-            ):
+        def forget_if_converted(status: str, pdf_path_res: Path) -> None:
+            # A DOCX now exists, so earlier timeouts of this PDF must not count
+            if quarantine is None:
+                return
+            if status == "ok" or (status == "skipped" and (output_dir / f"{pdf_path_res.stem}.docx").exists()):
+                quarantine.discard(pdf_path_res)
+
+        def check_timed_out() -> None:
+            for fut in [f for f in timed_out if f.done()]:
+                pdf_path_res = timed_out.pop(fut)
                 try:
-                    status, pdf_path_res, info = future.result()
-                    counts[status] += 1
-                    if status == "error":
-                        errors.append((pdf_path_res, info))
-                    if progress_cb is not None:
-                        progress_cb(sum(counts.values()), total)
-                except Exception as exc:
-                    # Handle unexpected errors from future.result()
-                    pdf_path_res = future_map.get(future, Path("unknown"))
-                    logger.error(f"Error inesperado procesando {pdf_path_res}: {exc}")
-                    counts["error"] += 1
-                    errors.append((pdf_path_res, str(exc)))
-                    if progress_cb is not None:
-                        progress_cb(sum(counts.values()), total)
-            return counts, errors
-
-        # Process with timeout
-        start_times = {fut: time.time() for fut in future_map}
-        pending = set(future_map.keys())
-        processed = 0
-        
-        # Calculate check interval: min of 5 seconds or half the timeout
-        check_interval = min(timeout_secs / 2, 5.0) if timeout_secs else 5.0
-
-        with tqdm(total=total, desc="Convirtiendo", unit="pdf") as pbar:
-            while pending:
-                done, still_pending = concurrent.futures.wait(
-                    pending,
-                    timeout=check_interval,
-                    return_when=concurrent.futures.FIRST_COMPLETED,
+                    status = fut.result()[0]
+                except Exception:
+                    continue
+                if status == "ok":
+                    logger.info(f"{pdf_path_res.name} terminó después del timeout")
+                forget_if_converted(status, pdf_path_res)
+
+        def record(status: str, pdf_path_res: Path, info: str) -> None:
+            counts[status] += 1
+            if status == "error":
+                errors.append((pdf_path_res, info))
+            pbar.update(1)
+            if progress_cb is not None:
+                progress_cb(sum(counts.values()), total)
+
+        for pdf_path in quarantined:
+            logger.info(f"Omitiendo {pdf_path.name} - en cuarentena")
+            record("quarantined", pdf_path, "")
+
+        while queued or future_map or retry_waiting:
+            check_timed_out()
+
+            # Re-queue retries whose backoff has elapsed
+            now = time.time()
+            for item in [r for r in retry_waiting if r[0] <= now]:
+                retry_waiting.remove(item)
+                queued.push_front(item[1], item[2])
+
+            # Keep as many conversions in flight as the current target allows
+            limit = autoscaler.target if autoscaler is not None else pool_size
+            limit = min(limit, memory_cap)
+            while len(future_map) < limit:
+                picked = queued.next(limit)
+                if picked is None:
+                    break
+                lane, pdf_path = picked
+                fut = executor.submit(
+                    _mark_started,
+                    start_times,
+                    pdf_path,
+                    output_dir,
+                    overwrite,
+                    profile_slow_secs=profile_slow_secs,
+                    profile_dir=profile_dir,
+                    chunk_pages=chunk_pages,
+                    scratch_dir=scratch_dir,
+                    claim_stale_secs=claim_stale_secs,
                 )
+                future_map[fut] = pdf_path
+                lane_map[fut] = lane
 
-                # Check for timeouts
+            wait_secs = check_interval
+            if retry_waiting:
+                next_retry = max(0.0, min(r[0] for r in retry_waiting) - time.time())
+                wait_secs = next_retry if wait_secs is None else min(wait_secs, next_retry)
+            if not future_map:
+                time.sleep(wait_secs or 0)
+                continue
+
+            done, still_pending = concurrent.futures.wait(
+                future_map,
+                timeout=wait_secs,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+            # Check for timeouts
+            if timeout_secs is not None:
                 now = time.time()
                 expired = [
                     fut
                     for fut in still_pending
-                    if now - start_times.get(fut, now) >= timeout_secs
+                    if now - start_times.get(future_map[fut], now) >= timeout_secs
                 ]
-                
                 for fut in expired:
                     fut.cancel()
-                    pdf_path_res = future_map[fut]
+                    pdf_path_res = future_map.pop(fut)
+                    timed_out[fut] = pdf_path_res
+                    start_times.pop(pdf_path_res, None)
+                    queued.release(lane_map.pop(fut))
                     error_msg = f"Timeout > {timeout_secs}s"
                     logger.warning(f"Timeout en {pdf_path_res.name}: {error_msg}")
-                    counts["error"] += 1
-                    errors.append((pdf_path_res, error_msg))
-                    pending.discard(fut)
-                    still_pending.discard(fut)
-                    processed += 1
-                    pbar.update(1)
-                    if progress_cb is not None:
-                        progress_cb(sum(counts.values()), total)
-
-                # Process completed tasks
-                for fut in done:
-                    pending.discard(fut)
-                    pdf_path_res = future_map[fut]
-                    try:
-                        status, pdf_path_ret, info = fut.result()
-                    except Exception as exc:
-                        logger.error(f"Error inesperado en {pdf_path_res.name}: {exc}")
-                        status, pdf_path_ret, info = "error", pdf_path_res, str(exc)
-                    
-                    counts[status] += 1
-                    if status == "error":
-                        errors.append((pdf_path_ret, info))
-                    processed += 1
-                    pbar.update(1)
-                    if progress_cb is not None:
-                        progress_cb(sum(counts.values()), total)
-                        
+                    # Not retried in this run: the timed-out thread is still converting it
+                    # (and writing checkpoints, which are kept for a later run)
+                    if quarantine is not None:
+                        quarantine.record_timeout(pdf_path_res, error_msg, quarantine_after_timeouts)
+                    record("error", pdf_path_res, error_msg)
+
+            # Process completed tasks
+            for fut in done:
+                pdf_path_res = future_map.pop(fut)
+                start_times.pop(pdf_path_res, None)
+                lane = lane_map.pop(fut)
+                queued.release(lane)
+                try:
+                    status, pdf_path_ret, info, code = fut.result()
+                except Exception as exc:
+                    logger.error(f"Error inesperado en {pdf_path_res.name}: {exc}")
+                    status, pdf_path_ret, info, code = "error", pdf_path_res, str(exc), ERR_UNKNOWN
+
+                if status == "error" and code in TRANSIENT_ERRORS and attempts[pdf_path_res] < retries:
+                    attempts[pdf_path_res] += 1
+                    delay = retry_backoff_secs * 2 ** (attempts[pdf_path_res] - 1)
+                    logger.warning(
+                        f"Reintento {attempts[pdf_path_res]}/{retries} de {pdf_path_res.name} "
+                        f"en {delay:.1f}s ({code})"
+                    )
+                    if code == ERR_MEMORY:
+                        # Fewer concurrent conversions leave more memory for the retry
+                        if autoscaler is not None:
+                            autoscaler.shrink("error de memoria")
+                        elif memory_cap > 1:
+                            memory_cap -= 1
+                            logger.info(f"Reduciendo workers a {memory_cap} por error de memoria")
+                    retry_waiting.append((time.time() + delay, lane, pdf_path_res))
+                    continue
+
+                if quarantine is not None and status == "error" and code in DETERMINISTIC_ERRORS:
+                    quarantine.add(pdf_path_res, code, info)
+                    discard_checkpoints(pdf_path_res)
+                forget_if_converted(status, pdf_path_res)
+                record(status, pdf_path_ret, info)
+
+            if autoscaler is not None:
+                autoscaler.update(sum(counts.values()))
+
+    # Leaving the executor waited for timed-out conversions still running
+    check_timed_out()
+    if quarantine is not None:
+        quarantine.save()
     return counts, errors
 
 
@@ -318,10 +1871,23 @@ def run_conversion(
     output: str,
     pattern: str = "*.pdf",
     recursive: bool = True,
-    workers: int = max(1, multiprocessing.cpu_count() - 1),
+    workers: Union[int, str] = max(1, multiprocessing.cpu_count() - 1),
     max_files: Optional[int] = None,
     overwrite: bool = False,
     timeout_secs: Optional[float] = None,
+    fast_lane_max_mb: Optional[float] = FAST_LANE_MAX_MB,
+    fast_lane_share: float = FAST_LANE_SHARE,
+    priority_files: Optional[Iterable[Union[str, Path]]] = None,
+    retries: int = DEFAULT_RETRIES,
+    retry_backoff_secs: float = DEFAULT_RETRY_BACKOFF_SECS,
+    quarantine_file: Optional[str] = None,
+    use_quarantine: bool = True,
+    quarantine_after_timeouts: int = QUARANTINE_AFTER_TIMEOUTS,
+    profile_slow_secs: Optional[float] = None,
+    profile_dir: Optional[str] = None,
+    chunk_pages: Optional[int] = None,
+    scratch_dir: Optional[str] = None,
+    claim_stale_secs: Optional[float] = CLAIM_STALE_SECS,
 ) -> Tuple[Counter, List[Tuple[Path, str]]]:
     """
     API reusable for converting PDFs to DOCX.
@@ -331,10 +1897,23 @@ def run_conversion(
         output: Output directory path for DOCX files
         pattern: Glob pattern to filter PDF files (default: "*.pdf")
         recursive: Whether to search recursively in directories (default: True)
-        workers: Number of concurrent workers (default: CPU count - 1)
+        workers: Number of concurrent workers (default: CPU count - 1), or "auto"
         max_files: Optional limit on number of files to process
         overwrite: Whether to overwrite existing DOCX files (default: False)
         timeout_secs: Optional timeout in seconds for each file conversion
+        fast_lane_max_mb: Files up to this size (MB) use the fast lane (None or 0 disables it)
+        fast_lane_share: Fraction of workers reserved for the fast lane
+        priority_files: Input files that always go to the fast lane, regardless of size
+        retries: Maximum retries per file for transient errors (default: 2)
+        retry_backoff_secs: Delay before the first retry, doubled on each attempt
+        quarantine_file: Quarantine JSON path (default: <output>/.pdf2docx_quarantine.json)
+        use_quarantine: Whether to skip and record deterministically failing PDFs
+        quarantine_after_timeouts: Quarantine a PDF after this many timeouts (default: 2)
+        profile_slow_secs: Profile conversions slower than this many seconds
+        profile_dir: Profile directory (default: <output>/.pdf2docx_profiles)
+        chunk_pages: Convert PDFs with more pages in resumable ranges of this size
+        scratch_dir: Checkpoint directory (default: <output>/.pdf2docx_chunks)
+        claim_stale_secs: Expiry of other processes' claims on an output (None disables claims)
         
     Returns:
         Tuple of (counts, errors) for use by CLI/GUI interfaces
@@ -366,7 +1945,26 @@ def run_conversion(
         pdf_files = pdf_files[:max_files]
 
     # Process the batch
-    counts, errors = process_batch(pdf_files, output_dir, workers, overwrite, timeout_secs)
+    counts, errors = process_batch(
+        pdf_files,
+        output_dir,
+        workers,
+        overwrite,
+        timeout_secs,
+        fast_lane_max_mb=fast_lane_max_mb,
+        fast_lane_share=fast_lane_share,
+        priority_files=[Path(p) for p in priority_files] if priority_files else None,
+        retries=retries,
+        retry_backoff_secs=retry_backoff_secs,
+        quarantine_file=quarantine_file,
+        use_quarantine=use_quarantine,
+        quarantine_after_timeouts=quarantine_after_timeouts,
+        profile_slow_secs=profile_slow_secs,
+        profile_dir=Path(profile_dir) if profile_dir else None,
+        chunk_pages=chunk_pages,
+        scratch_dir=Path(scratch_dir) if scratch_dir else None,
+        claim_stale_secs=claim_stale_secs,
+    )
     
     logger.info("=" * 60)
     logger.info("Proceso de conversión completado")
@@ -381,6 +1979,14 @@ def main() -> None:
     Parses arguments and initiates the PDF to DOCX conversion process.
     """
     args = parse_args()
+    if args.list_only or args.dry_run:
+        # Keep stdout clean for scripts: only the listing or plan goes there, logs go to stderr
+        root_logger = logging.getLogger()
+        if args.list_only:
+            root_logger.setLevel(logging.WARNING)
+        for handler in root_logger.handlers:
+            if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout:
+                handler.setStream(sys.stderr)
     
     # Expand input files
     pdf_files = expand_inputs(args.inputs, args.pattern, args.recursive)
@@ -392,6 +1998,30 @@ def main() -> None:
     if args.max_files is not None:
         pdf_files = pdf_files[:args.max_files]
 
+    if args.list_only:
+        for pdf_path in pdf_files:
+            print(pdf_path)
+        return
+
+    quarantine_file = resolve_quarantine_file(
+        Path(args.output), args.quarantine_file, not args.no_quarantine
+    )
+
+    if args.dry_run:
+        plan = plan_batch(pdf_files, Path(args.output), args.overwrite, quarantine_file)
+        for action, pdf_path, detail in plan:
+            print(f"{action:<12} {pdf_path}  ({detail})")
+        planned = Counter(action for action, _, _ in plan)
+        print("\n" + "=" * 60)
+        print("SIMULACIÓN (--dry-run): no se convirtió ningún archivo")
+        print("=" * 60)
+        print(f"🔄 A convertir  : {planned.get('convert', 0)}")
+        print(f"⏭️  Saltados     : {planned.get('skipped', 0)}")
+        print(f"🚫 Cuarentena   : {planned.get('quarantined', 0)}")
+        print(f"❌ Errores      : {planned.get('error', 0)}")
+        print("=" * 60)
+        return
+
     logger.info(f"📂 Archivos a procesar: {len(pdf_files)}")
     logger.info(f"⚙️  Workers: {args.workers}")
     logger.info(f"📁 Carpeta de salida: {args.output}")
@@ -403,6 +2033,19 @@ def main() -> None:
         args.workers,
         args.overwrite,
         args.timeout_per_file,
+        fast_lane_max_mb=args.fast_lane_max_mb,
+        fast_lane_share=args.fast_lane_share,
+        priority_files=[Path(p) for p in args.priority_files] if args.priority_files else None,
+        retries=args.retries,
+        retry_backoff_secs=args.retry_backoff,
+        quarantine_file=quarantine_file,
+        use_quarantine=quarantine_file is not None,
+        quarantine_after_timeouts=args.quarantine_after_timeouts,
+        profile_slow_secs=args.profile_slow,
+        profile_dir=Path(args.profile_dir) if args.profile_dir else None,
+        chunk_pages=args.chunk_pages,
+        scratch_dir=Path(args.scratch_dir) if args.scratch_dir else None,
+        claim_stale_secs=args.claim_stale_secs,
     )
 
     # Print summary
@@ -411,6 +2054,7 @@ def main() -> None:
     print("=" * 60)
     print(f"✅ Exitosos     : {counts.get('ok', 0)}")
     print(f"⏭️  Saltados     : {counts.get('skipped', 0)}")
+    print(f"🚫 Cuarentena   : {counts.get('quarantined', 0)}")
     print(f"❌ Errores      : {counts.get('error', 0)}")
     print("=" * 60)
 
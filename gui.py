@@ -6,7 +6,7 @@ from typing import Optional
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 
-from converter import expand_inputs, process_batch
+from converter import AUTO_WORKERS, expand_inputs, process_batch
 
 # Configure logging for GUI
 logging.basicConfig(
@@ -98,7 +98,10 @@ class ConverterGUI:
 
         ttk.Label(row1, text="Workers:").pack(side="left", padx=(0, 4))
         self.workers_var = tk.IntVar(value=4)
-        ttk.Spinbox(row1, from_=1, to=32, width=5, textvariable=self.workers_var).pack(side="left", padx=(0, 12))
+        ttk.Spinbox(row1, from_=1, to=32, width=5, textvariable=self.workers_var).pack(side="left", padx=(0, 4))
+
+        self.auto_workers_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(row1, text="Auto", variable=self.auto_workers_var).pack(side="left", padx=(0, 12))
 
         self.overwrite_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(row1, text="Sobrescribir existentes", variable=self.overwrite_var).pack(side="left")
@@ -214,7 +217,7 @@ class ConverterGUI:
         # Get configuration
         pattern = self.pattern_var.get().strip() or "*.pdf"
         recursive = self.recursive_var.get()
-        workers = max(1, self.workers_var.get())
+        workers = AUTO_WORKERS if self.auto_workers_var.get() else max(1, self.workers_var.get())
         
         max_files_val = self.max_files_var.get().strip()
         max_files = None
@@ -346,16 +349,19 @@ class ConverterGUI:
             
         ok = self.counts.get("ok", 0)
         skipped = self.counts.get("skipped", 0)
+        quarantined = self.counts.get("quarantined", 0)
         errors_n = self.counts.get("error", 0)
         
         # Log summary
         self.log_message(f"✅ Exitosos: {ok}")
         self.log_message(f"⏭️  Saltados: {skipped}")
+        self.log_message(f"🚫 Cuarentena: {quarantined}")
         self.log_message(f"❌ Errores: {errors_n}")
         
         summary = f"Conversión completada:\n\n"
         summary += f"✅ Exitosos: {ok}\n"
         summary += f"⏭️  Saltados: {skipped}\n"
+        summary += f"🚫 Cuarentena: {quarantined}\n"
         summary += f"❌ Errores: {errors_n}"
         
         if self.errors:
@@ -26,7 +26,9 @@ a = Analysis(
     hookspath=['.'],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Heavy packages that pdf2docx/OpenCV/NumPy can pull in but the app never uses;
+    # leaving them out shrinks the bundle that onefile has to unpack on every start
+    excludes=['matplotlib', 'scipy', 'pandas', 'IPython', 'jupyter', 'notebook', 'PyQt5', 'PySide2', 'pytest'],
     noarchive=False,
     optimize=0,
 )
@@ -43,7 +45,8 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    # UPX-compressed DLLs must be decompressed on every launch, which slows startup
+    upx=False,
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -0,0 +1,110 @@
+"""
+WorkerAutoscaler decisions, driven by a fake clock, CPU counter and memory
+reading instead of the real host.
+"""
+import logging
+import unittest
+from unittest import mock
+
+import converter
+
+CPUS = 4
+
+
+class FakeHost:
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.cpu_secs = 0.0
+        self.mem_free = 0.5
+
+
+class WorkerAutoscalerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.host = FakeHost()
+        for target, replacement in (
+            ("converter.time.monotonic", lambda: self.host.now),
+            ("converter._cpu_seconds_used", lambda: self.host.cpu_secs),
+            ("converter.free_memory_fraction", lambda: self.host.mem_free),
+            ("converter.detect_cpu_limit", lambda: CPUS),
+        ):
+            patcher = mock.patch(target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.scaler = converter.WorkerAutoscaler()
+        self.completed = 0
+
+    def window(self, finished: int, secs: float, cpu_util: float = 0.5) -> int:
+        """Advance the fake host by one window and let the autoscaler react."""
+        self.completed += finished
+        self.host.now += secs
+        self.host.cpu_secs += secs * CPUS * cpu_util
+        return self.scaler.update(self.completed)
+
+    def test_starts_at_cpu_minus_one_up_to_twice_the_cpus(self) -> None:
+        self.assertEqual(self.scaler.target, CPUS - 1)
+        self.assertEqual(self.scaler.max_workers, CPUS * converter.AUTOSCALE_MAX_FACTOR)
+
+    def test_does_not_judge_a_window_without_enough_finished_files(self) -> None:
+        self.assertEqual(self.window(finished=1, secs=60), 3)
+        self.assertEqual(self.window(finished=0, secs=60), 3)
+        # Once enough files finish, the whole (long) window is judged at once
+        self.assertEqual(self.window(finished=2, secs=60), 4)
+
+    def test_ignores_updates_within_the_interval(self) -> None:
+        self.assertEqual(self.window(finished=3, secs=converter.AUTOSCALE_INTERVAL_SECS / 2), 3)
+
+    def test_grows_with_spare_cpu_and_memory(self) -> None:
+        self.assertEqual(self.window(finished=3, secs=10, cpu_util=0.5), 4)
+
+    def test_does_not_grow_when_cpu_is_saturated(self) -> None:
+        self.assertEqual(self.window(finished=3, secs=10, cpu_util=0.95), 3)
+
+    def test_shrinks_under_memory_pressure(self) -> None:
+        self.host.mem_free = converter.AUTOSCALE_MEM_LOW / 2
+        self.assertEqual(self.window(finished=0, secs=10), 2)
+
+    def test_never_goes_below_min_workers(self) -> None:
+        self.host.mem_free = 0.0
+        for _ in range(10):
+            self.window(finished=0, secs=10)
+        self.assertEqual(self.scaler.target, 1)
+
+    def test_reverts_an_increase_that_did_not_help(self) -> None:
+        self.assertEqual(self.window(finished=3, secs=10), 4)
+        # 4 workers finish 4 files in the same time 3 workers needed for 4 files
+        self.assertEqual(self.window(finished=4, secs=40 / 3), 3)
+
+    def test_backs_off_longer_after_repeated_unproductive_increases(self) -> None:
+        # Throughput saturates at 3 workers: 0.3 files/s, however many run
+        grows = []
+        for step in range(120):
+            target = self.scaler.target
+            finished = max(converter.AUTOSCALE_WINDOW_COMPLETIONS, target)
+            new_target = self.window(finished=finished, secs=finished / 0.3)
+            if new_target > target:
+                grows.append(step)
+
+        gaps = [b - a for a, b in zip(grows, grows[1:])]
+        self.assertTrue(all(later > earlier for earlier, later in zip(gaps, gaps[1:])), gaps)
+        # Without the back-off it would retry every 5 windows (24 times)
+        self.assertLessEqual(len(grows), 7)
+        self.assertLessEqual(max(gaps), converter.AUTOSCALE_MAX_HOLD_WINDOWS + 2)
+
+    def test_productive_increase_resets_the_back_off(self) -> None:
+        self.window(finished=3, secs=10)
+        self.window(finished=4, secs=40 / 3)
+        self.assertEqual(self.scaler._hold_windows, converter.AUTOSCALE_HOLD_WINDOWS)
+        for _ in range(converter.AUTOSCALE_HOLD_WINDOWS):
+            self.assertEqual(self.window(finished=3, secs=10), 3)
+        self.assertEqual(self.window(finished=3, secs=10), 4)
+        # This time 4 workers really are faster
+        self.assertEqual(self.window(finished=4, secs=5), 5)
+        self.assertEqual(self.scaler._unproductive_grows, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Page-range checkpoints: an interrupted chunked conversion resumes from the
+ranges already on disk, and pdf2docx's font scan cache is version-gated and
+undone after use.
+"""
+import importlib.util
+import json
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import converter
+
+
+class StubConverter:
+    """Just enough of pdf2docx.Converter for convert_in_chunks."""
+
+    def __init__(self, num_pages: int, fail_at: int = -1) -> None:
+        self.fitz_doc = [object() for _ in range(num_pages)]
+        self.default_settings = {"debug": False}
+        self.fail_at = fail_at
+        self.parsed = []
+        self.restored = []
+
+    def parse(self, start: int, end: int, **settings) -> None:
+        if start == self.fail_at:
+            raise RuntimeError("process killed")
+        self.parsed.append((start, end))
+
+    def serialize(self, filename: str) -> None:
+        Path(filename).write_text(json.dumps(self.parsed[-1]), encoding="utf-8")
+
+    def load_pages(self, start, end, pages) -> None:
+        self.restored = []
+
+    def deserialize(self, filename: str) -> None:
+        self.restored.append(tuple(json.loads(Path(filename).read_text(encoding="utf-8"))))
+
+    def make_docx(self, filename: str, **settings) -> None:
+        Path(filename).write_text(json.dumps(self.restored), encoding="utf-8")
+
+
+class ChunkCheckpointTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.pdf = self.dir / "expediente.pdf"
+        self.pdf.write_bytes(b"%PDF-1.4 huge")
+        self.docx = self.dir / "expediente.docx"
+        self.scratch = self.dir / converter.CHUNKS_DIRNAME
+
+    def convert(self, stub: StubConverter) -> None:
+        checkpoint_dir = converter.chunk_checkpoint_dir(self.pdf, self.scratch)
+        converter.convert_in_chunks(stub, self.pdf, self.docx, 3, checkpoint_dir)
+
+    def test_second_run_only_parses_missing_ranges(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.convert(StubConverter(10, fail_at=6))
+        checkpoint_dir = converter.chunk_checkpoint_dir(self.pdf, self.scratch)
+        self.assertEqual(
+            sorted(p.name for p in checkpoint_dir.glob("pages_*.json")),
+            ["pages_00001-00003.json", "pages_00004-00006.json"],
+        )
+
+        resumed = StubConverter(10)
+        self.convert(resumed)
+        self.assertEqual(resumed.parsed, [(6, 9), (9, 10)])
+        # The DOCX is built from every range, in page order
+        written = json.loads(self.docx.read_text(encoding="utf-8"))
+        self.assertEqual([tuple(r) for r in written], [(0, 3), (3, 6), (6, 9), (9, 10)])
+        self.assertFalse(checkpoint_dir.exists())
+
+    def test_checkpoints_of_a_changed_pdf_are_not_reused(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.convert(StubConverter(10, fail_at=3))
+        old_dir = converter.chunk_checkpoint_dir(self.pdf, self.scratch)
+
+        self.pdf.write_bytes(b"%PDF-1.4 huge, edited")
+        resumed = StubConverter(10)
+        self.convert(resumed)
+        self.assertEqual(resumed.parsed, [(0, 3), (3, 6), (6, 9), (9, 10)])
+        self.assertFalse(old_dir.exists())
+
+    def test_font_scan_cache_requires_a_verified_pdf2docx_version(self) -> None:
+        with mock.patch("converter._installed_version", return_value="0.6.0"), \
+                mock.patch("converter.importlib.import_module") as import_module:
+            self.assertFalse(converter._install_font_scan_cache())
+        import_module.assert_not_called()
+
+    @unittest.skipUnless(importlib.util.find_spec("pdf2docx"), "pdf2docx no instalado")
+    def test_font_scan_cache_scans_once_and_is_undone(self) -> None:
+        if converter._installed_version("pdf2docx") not in converter.FONT_SCAN_CACHE_VERSIONS:
+            self.skipTest("versión de pdf2docx no verificada")
+        pages_module = importlib.import_module("pdf2docx.page.Pages")
+        original = pages_module.Fonts
+        fitz_doc = object()
+        with mock.patch.object(original, "extract", return_value="fonts") as extract:
+            with converter._reuse_font_scan(fitz_doc):
+                self.assertIsNot(pages_module.Fonts, original)
+                for _ in range(3):
+                    self.assertEqual(pages_module.Fonts.extract(fitz_doc), "fonts")
+            self.assertEqual(extract.call_count, 1)
+        self.assertIs(pages_module.Fonts, original)
+
+
+if __name__ == "__main__":
+    unittest.main()
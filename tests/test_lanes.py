@@ -0,0 +1,112 @@
+"""
+LaneScheduler: lane classification, the fast lane's reserved share and
+work stealing when one lane runs dry.
+"""
+import logging
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from converter import LANE_BULK, LANE_FAST, LaneScheduler
+
+SMALL = 10
+LARGE = 1000
+MAX_FAST = 100
+
+
+class LaneSchedulerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def pdfs(self, prefix: str, count: int, size: int):
+        paths = []
+        for i in range(count):
+            path = self.dir / f"{prefix}{i}.pdf"
+            path.write_bytes(b"x" * size)
+            paths.append(path)
+        return paths
+
+    def drain(self, scheduler: LaneScheduler, limit: int):
+        """Start files until no lane may start another one."""
+        started = []
+        while True:
+            picked = scheduler.next(limit)
+            if picked is None:
+                return started
+            started.append(picked[0])
+
+    def test_reserved_share(self) -> None:
+        scheduler = LaneScheduler([], MAX_FAST, fast_lane_share=0.25)
+        self.assertEqual(scheduler.reserved(1), 1)
+        self.assertEqual(scheduler.reserved(2), 1)
+        self.assertEqual(scheduler.reserved(4), 1)
+        self.assertEqual(scheduler.reserved(8), 2)
+        # The bulk lane always keeps at least one slot when there are two or more
+        self.assertEqual(LaneScheduler([], MAX_FAST, fast_lane_share=1.0).reserved(4), 3)
+        self.assertEqual(LaneScheduler([], MAX_FAST, fast_lane_share=0.0).reserved(4), 0)
+
+    def test_classifies_by_size_priority_and_missing_files(self) -> None:
+        small, = self.pdfs("s", 1, SMALL)
+        large, urgent = self.pdfs("l", 2, LARGE)
+        missing = self.dir / "missing.pdf"
+        # Priority paths match however they are spelled
+        relative_urgent = Path(os.path.relpath(urgent))
+        scheduler = LaneScheduler([small, large, urgent, missing], MAX_FAST, priority_files=[relative_urgent])
+        self.assertEqual(list(scheduler.queues[LANE_FAST]), [small, urgent, missing])
+        self.assertEqual(list(scheduler.queues[LANE_BULK]), [large])
+
+    def test_without_size_limit_everything_is_bulk(self) -> None:
+        files = self.pdfs("s", 2, SMALL)
+        scheduler = LaneScheduler(files, None)
+        self.assertEqual(list(scheduler.queues[LANE_BULK]), files)
+
+    def test_fast_lane_keeps_its_share_while_both_lanes_have_work(self) -> None:
+        scheduler = LaneScheduler(self.pdfs("s", 5, SMALL) + self.pdfs("l", 5, LARGE), MAX_FAST)
+        started = self.drain(scheduler, limit=4)
+        self.assertEqual(sorted(started), [LANE_BULK] * 3 + [LANE_FAST])
+
+        # A finished bulk file is replaced by another bulk file, not a second small one
+        scheduler.release(LANE_BULK)
+        self.assertEqual(self.drain(scheduler, limit=4), [LANE_BULK])
+        # A finished small file is replaced by the next small one
+        scheduler.release(LANE_FAST)
+        self.assertEqual(self.drain(scheduler, limit=4), [LANE_FAST])
+
+    def test_fast_lane_uses_free_bulk_slots(self) -> None:
+        scheduler = LaneScheduler(self.pdfs("s", 5, SMALL) + self.pdfs("l", 1, LARGE), MAX_FAST)
+        started = self.drain(scheduler, limit=4)
+        self.assertEqual(sorted(started), [LANE_BULK] + [LANE_FAST] * 3)
+
+    def test_lanes_steal_all_slots_when_the_other_is_empty(self) -> None:
+        bulk_only = LaneScheduler(self.pdfs("l", 6, LARGE), MAX_FAST)
+        self.assertEqual(self.drain(bulk_only, limit=4), [LANE_BULK] * 4)
+        fast_only = LaneScheduler(self.pdfs("s", 6, SMALL), MAX_FAST)
+        self.assertEqual(self.drain(fast_only, limit=4), [LANE_FAST] * 4)
+
+    def test_limit_of_one_serves_small_files_first(self) -> None:
+        scheduler = LaneScheduler(self.pdfs("l", 2, LARGE) + self.pdfs("s", 2, SMALL), MAX_FAST)
+        order = []
+        while scheduler:
+            lane, _ = scheduler.next(1)
+            self.assertIsNone(scheduler.next(1))
+            order.append(lane)
+            scheduler.release(lane)
+        self.assertEqual(order, [LANE_FAST, LANE_FAST, LANE_BULK, LANE_BULK])
+
+    def test_push_front_requeues_at_the_head_of_its_lane(self) -> None:
+        files = self.pdfs("l", 3, LARGE)
+        scheduler = LaneScheduler(files, MAX_FAST)
+        lane, first = scheduler.next(1)
+        scheduler.release(lane)
+        scheduler.push_front(lane, first)
+        self.assertEqual(scheduler.next(1), (LANE_BULK, first))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+OutputClaim must let exactly one run convert each PDF, also when several
+runs race to take over the same abandoned lock.
+"""
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from pathlib import Path
+
+import converter
+
+CLAIMANTS = 8
+ROUNDS = 10
+
+
+class OutputClaimTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        # Widen the window between reading a lock and acting on it, so the
+        # claimants reliably interleave there
+        read_owner = converter.OutputClaim._read_owner
+
+        def slow_read_owner(claim, *args):
+            owner = read_owner(claim, *args)
+            time.sleep(0.005)
+            return owner
+
+        patcher = mock.patch.object(converter.OutputClaim, "_read_owner", slow_read_owner)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stale_lock_is_taken_over_by_exactly_one_claimant(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            docx_path = Path(tmp) / "x.docx"
+            for _ in range(ROUNDS):
+                lock = docx_path.with_name(docx_path.name + converter.CLAIM_SUFFIX)
+                lock.write_text("otherhost 1 1 0 0\n", encoding="utf-8")
+                old = time.time() - 100
+                os.utime(lock, (old, old))
+
+                claims = [converter.OutputClaim(docx_path, stale_secs=10) for _ in range(CLAIMANTS)]
+                barrier = threading.Barrier(CLAIMANTS)
+                won = []
+
+                def claim(c: converter.OutputClaim) -> None:
+                    barrier.wait()
+                    won.append(c.acquire())
+
+                threads = [threading.Thread(target=claim, args=(c,)) for c in claims]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+                for c in claims:
+                    c.release()
+
+                self.assertEqual(sum(won), 1)
+                self.assertEqual(os.listdir(tmp), [])
+
+
+def make_stale(lock: Path) -> None:
+    old = time.time() - 100
+    os.utime(lock, (old, old))
+
+
+class OutputClaimTakeoverTest(unittest.TestCase):
+    """Interleavings forced step by step, at the points where the lock can change."""
+
+    def setUp(self) -> None:
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.docx_path = self.dir / "x.docx"
+        self.lock = self.docx_path.with_name(self.docx_path.name + converter.CLAIM_SUFFIX)
+
+    def claim(self) -> converter.OutputClaim:
+        claim = converter.OutputClaim(self.docx_path, stale_secs=10)
+        self.addCleanup(claim.release)
+        return claim
+
+    def assert_single_owner(self, *claims: converter.OutputClaim) -> None:
+        self.assertEqual(sum(c.held() for c in claims), 1)
+        # No takeover markers or tombstones are left behind
+        self.assertEqual(os.listdir(self.dir), [self.lock.name])
+
+    def test_late_claimant_does_not_move_a_lock_taken_over_meanwhile(self) -> None:
+        self.lock.write_text("otherhost 1 1 0 0\n", encoding="utf-8")
+        make_stale(self.lock)
+        late, first, third = self.claim(), self.claim(), self.claim()
+        real_is_stale, real_link = late._is_stale, os.link
+
+        def judged_stale_then_first_takes_over(*args):
+            stale = real_is_stale(*args)
+            self.assertTrue(first.acquire())
+            return stale
+
+        def third_claims_during_restore(*args):
+            third.acquire()
+            return real_link(*args)
+
+        with mock.patch.object(late, "_is_stale", side_effect=judged_stale_then_first_takes_over), \
+                mock.patch("converter.os.link", side_effect=third_claims_during_restore):
+            self.assertFalse(late.acquire())
+        self.assertFalse(third.acquire())
+        self.assertTrue(first.held())
+        self.assert_single_owner(late, first, third)
+
+    def test_third_claimant_during_the_restore_window(self) -> None:
+        # A live owner looks stale (e.g. it was suspended) ...
+        owner = self.claim()
+        self.assertTrue(owner.acquire())
+        make_stale(self.lock)
+        taker, second, third = self.claim(), self.claim(), self.claim()
+        real_rename, real_link = os.rename, os.link
+
+        # ... and releases right before the takeover moves the lock, so the
+        # takeover moves the brand-new lock of `second` by mistake ...
+        def owner_releases_and_second_claims(src, dst):
+            if Path(src) == self.lock:
+                owner.release()
+                self.assertTrue(second.acquire())
+            return real_rename(src, dst)
+
+        # ... and `third` claims the empty path before it can be put back
+        def third_claims_before_restore(*args):
+            self.assertTrue(third.acquire())
+            return real_link(*args)
+
+        with mock.patch("converter.os.rename", side_effect=owner_releases_and_second_claims), \
+                mock.patch("converter.os.link", side_effect=third_claims_before_restore):
+            self.assertFalse(taker.acquire())
+        # `second` was told it won, but it no longer holds the lock and will not publish
+        self.assertFalse(second.held())
+        self.assertTrue(third.held())
+        self.assert_single_owner(owner, taker, second, third)
+
+    def test_lost_claim_does_not_remove_the_new_owner_lock(self) -> None:
+        suspended, successor = self.claim(), self.claim()
+        self.assertTrue(suspended.acquire())
+        make_stale(self.lock)
+        self.assertTrue(successor.acquire())
+        self.assertFalse(suspended.held())
+        suspended.release()
+        self.assertTrue(successor.held())
+        self.assert_single_owner(suspended, successor)
+
+    def test_live_lock_is_not_taken_over(self) -> None:
+        holder, other = self.claim(), self.claim()
+        self.assertTrue(holder.acquire())
+        self.assertFalse(other.acquire())
+        holder.release()
+        self.assertFalse(self.lock.exists())
+        self.assertTrue(other.acquire())
+
+
+if __name__ == "__main__":
+    unittest.main()
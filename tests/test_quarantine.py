@@ -0,0 +1,106 @@
+"""
+Quarantine: file-version fingerprints, timeout counting and merging with
+changes saved by other runs.
+"""
+import json
+import logging
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from converter import ERR_CONVERSION, ERR_TIMEOUT, Quarantine
+
+
+class QuarantineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.path = self.dir / "quarantine.json"
+        self.pdf = self.dir / "poison.pdf"
+        self.pdf.write_bytes(b"%PDF-1.4 broken")
+
+    def saved(self) -> dict:
+        with open(self.path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def test_added_file_is_skipped_by_later_runs(self) -> None:
+        Quarantine(self.path).add(self.pdf, ERR_CONVERSION, "boom")
+        later = Quarantine(self.path)
+        self.assertTrue(later.contains(self.pdf))
+        self.assertEqual(later.reason(self.pdf), "boom")
+
+    def test_changed_file_gets_another_chance(self) -> None:
+        Quarantine(self.path).add(self.pdf, ERR_CONVERSION, "boom")
+        self.pdf.write_bytes(b"%PDF-1.4 fixed and longer")
+        later = Quarantine(self.path)
+        self.assertFalse(later.contains(self.pdf))
+        later.save()
+        self.assertEqual(self.saved(), {})
+
+    def test_same_size_but_newer_file_gets_another_chance(self) -> None:
+        Quarantine(self.path).add(self.pdf, ERR_CONVERSION, "boom")
+        st = self.pdf.stat()
+        os.utime(self.pdf, (st.st_atime, st.st_mtime + 10))
+        self.assertFalse(Quarantine(self.path).contains(self.pdf))
+
+    def test_vanished_file_is_not_quarantined(self) -> None:
+        quarantine = Quarantine(self.path)
+        quarantine.add(self.pdf, ERR_CONVERSION, "boom")
+        self.pdf.unlink()
+        self.assertFalse(quarantine.contains(self.pdf))
+
+    def test_timeouts_quarantine_once_the_limit_is_reached(self) -> None:
+        self.assertFalse(Quarantine(self.path).record_timeout(self.pdf, "Timeout > 1s", limit=2))
+        # Counted across runs, but not yet quarantined
+        second_run = Quarantine(self.path)
+        self.assertFalse(second_run.contains(self.pdf))
+        self.assertTrue(second_run.record_timeout(self.pdf, "Timeout > 1s", limit=2))
+        third_run = Quarantine(self.path)
+        self.assertTrue(third_run.contains(self.pdf))
+        self.assertEqual(self.saved()[str(self.pdf.resolve())]["code"], ERR_TIMEOUT)
+
+    def test_timeouts_of_an_older_version_do_not_count(self) -> None:
+        Quarantine(self.path).record_timeout(self.pdf, "Timeout > 1s", limit=2)
+        self.pdf.write_bytes(b"%PDF-1.4 new version")
+        self.assertFalse(Quarantine(self.path).record_timeout(self.pdf, "Timeout > 1s", limit=2))
+
+    def test_zero_limit_never_counts_timeouts(self) -> None:
+        quarantine = Quarantine(self.path)
+        for _ in range(3):
+            self.assertFalse(quarantine.record_timeout(self.pdf, "Timeout > 1s", limit=0))
+        self.assertFalse(self.path.exists())
+
+    def test_discard_clears_the_timeout_count(self) -> None:
+        quarantine = Quarantine(self.path)
+        quarantine.record_timeout(self.pdf, "Timeout > 1s", limit=2)
+        quarantine.discard(self.pdf)
+        self.assertEqual(self.saved(), {})
+        self.assertFalse(Quarantine(self.path).record_timeout(self.pdf, "Timeout > 1s", limit=2))
+
+    def test_save_keeps_entries_written_by_other_runs(self) -> None:
+        other_pdf = self.dir / "other.pdf"
+        other_pdf.write_bytes(b"%PDF-1.4 also broken")
+        first, second = Quarantine(self.path), Quarantine(self.path)
+        first.add(self.pdf, ERR_CONVERSION, "boom")
+        second.add(other_pdf, ERR_CONVERSION, "bang")
+        self.assertEqual(set(self.saved()), {str(self.pdf.resolve()), str(other_pdf.resolve())})
+
+        # Removing an entry does not resurrect or drop the other run's entries
+        first.discard(self.pdf)
+        self.assertEqual(set(self.saved()), {str(other_pdf.resolve())})
+
+    def test_unreadable_file_is_ignored(self) -> None:
+        self.path.write_text("{not json", encoding="utf-8")
+        quarantine = Quarantine(self.path)
+        self.assertFalse(quarantine.contains(self.pdf))
+        quarantine.add(self.pdf, ERR_CONVERSION, "boom")
+        self.assertIn(str(self.pdf.resolve()), self.saved())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Error classification and the retry/quarantine policy of process_batch.
+
+convert_single is replaced by a scripted fake, so these tests exercise the
+scheduling loop without converting any real PDF.
+"""
+import json
+import logging
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import converter
+from converter import (
+    ERR_CONVERSION,
+    ERR_EMPTY,
+    ERR_IO,
+    ERR_MEMORY,
+    ERR_PERMISSION,
+    ERR_UNKNOWN,
+    classify_error,
+)
+
+
+class ConversionException(Exception):
+    """Same name as pdf2docx's wrapper for per-page failures."""
+
+
+class FileDataError(RuntimeError):
+    """Same name as PyMuPDF's error for broken documents."""
+
+
+def raised(make_exc) -> BaseException:
+    try:
+        make_exc()
+    except BaseException as exc:
+        return exc
+    raise AssertionError("nothing raised")
+
+
+def wrapped_in_conversion_exception(inner: BaseException):
+    """Mimic pdf2docx: re-raise inside the except block (implicit __context__)."""
+    def make():
+        try:
+            raise inner
+        except Exception as e:
+            raise ConversionException(f"Error when parsing page 3: {e}")
+    return make
+
+
+class ClassifyErrorTest(unittest.TestCase):
+
+    def test_memory(self) -> None:
+        self.assertEqual(classify_error(MemoryError()), ERR_MEMORY)
+        mupdf_oom = RuntimeError("code=2: malloc (1048576 bytes) failed")
+        self.assertEqual(classify_error(mupdf_oom), ERR_MEMORY)
+        self.assertEqual(classify_error(raised(wrapped_in_conversion_exception(mupdf_oom))), ERR_MEMORY)
+        self.assertEqual(classify_error(raised(wrapped_in_conversion_exception(MemoryError()))), ERR_MEMORY)
+
+    def test_permission_and_io(self) -> None:
+        self.assertEqual(classify_error(PermissionError("locked")), ERR_PERMISSION)
+        self.assertEqual(classify_error(OSError("stale NFS file handle")), ERR_IO)
+        self.assertEqual(classify_error(raised(wrapped_in_conversion_exception(OSError("EIO")))), ERR_IO)
+
+    def test_known_parse_failures(self) -> None:
+        self.assertEqual(classify_error(raised(wrapped_in_conversion_exception(IndexError("x")))), ERR_CONVERSION)
+        self.assertEqual(classify_error(FileDataError("cannot open broken document")), ERR_CONVERSION)
+
+    def test_explicit_cause_is_followed(self) -> None:
+        def make():
+            try:
+                raise MemoryError()
+            except MemoryError as e:
+                raise ValueError("while building the document") from e
+        self.assertEqual(classify_error(raised(make)), ERR_MEMORY)
+
+    def test_unrecognised_errors_are_unknown(self) -> None:
+        self.assertEqual(classify_error(AttributeError("'Fonts' has no attribute 'extract'")), ERR_UNKNOWN)
+        self.assertEqual(classify_error(ValueError("bad value")), ERR_UNKNOWN)
+        self.assertEqual(classify_error(RuntimeError("something else")), ERR_UNKNOWN)
+
+
+class FakeConversions:
+    """Scripted stand-in for convert_single: one list of outcomes per file name."""
+
+    def __init__(self, script: dict, delay: float = 0.0) -> None:
+        self.script = {name: list(outcomes) for name, outcomes in script.items()}
+        self.delay = delay
+        self.calls: dict = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, pdf_path: Path, output_dir: Path, overwrite: bool, **kwargs):
+        with self.lock:
+            self.calls.setdefault(pdf_path.name, []).append(time.monotonic())
+            outcomes = self.script[pdf_path.name]
+            status, code = outcomes.pop(0) if len(outcomes) > 1 else outcomes[0]
+        time.sleep(self.delay)
+        if status == "ok":
+            output_dir.mkdir(parents=True, exist_ok=True)
+            (output_dir / f"{pdf_path.stem}.docx").write_bytes(b"docx")
+        return status, pdf_path, "" if status == "ok" else f"fallo {code}", code
+
+
+class ProcessBatchRetryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.output = self.dir / "out"
+        self.quarantine_file = self.output / converter.QUARANTINE_FILENAME
+
+    def pdf(self, name: str) -> Path:
+        path = self.dir / name
+        path.write_bytes(b"%PDF-1.4")
+        return path
+
+    def run_batch(self, files, fake: FakeConversions, **kwargs):
+        kwargs.setdefault("retry_backoff_secs", 0.01)
+        with mock.patch("converter.convert_single", fake):
+            return converter.process_batch(files, self.output, 2, False, **kwargs)
+
+    def quarantined(self) -> dict:
+        if not self.quarantine_file.exists():
+            return {}
+        with open(self.quarantine_file, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def test_transient_error_is_retried_until_it_succeeds(self) -> None:
+        pdf = self.pdf("locked.pdf")
+        fake = FakeConversions({"locked.pdf": [("error", ERR_PERMISSION), ("error", ERR_IO), ("ok", "")]})
+        counts, errors = self.run_batch([pdf], fake)
+        self.assertEqual(len(fake.calls["locked.pdf"]), 3)
+        self.assertEqual((counts["ok"], errors), (1, []))
+        self.assertEqual(self.quarantined(), {})
+
+    def test_retries_back_off_exponentially_and_give_up(self) -> None:
+        pdf = self.pdf("flaky.pdf")
+        fake = FakeConversions({"flaky.pdf": [("error", ERR_IO)]})
+        counts, errors = self.run_batch([pdf], fake, retries=2, retry_backoff_secs=0.1)
+        calls = fake.calls["flaky.pdf"]
+        self.assertEqual(len(calls), 3)
+        self.assertGreaterEqual(calls[1] - calls[0], 0.1)
+        self.assertGreaterEqual(calls[2] - calls[1], 0.2)
+        self.assertEqual(counts["error"], 1)
+        self.assertEqual(len(errors), 1)
+        # Transient failures are never quarantined
+        self.assertEqual(self.quarantined(), {})
+
+    def test_unknown_errors_are_retried_not_quarantined(self) -> None:
+        pdf = self.pdf("odd.pdf")
+        fake = FakeConversions({"odd.pdf": [("error", ERR_UNKNOWN)]})
+        counts, _ = self.run_batch([pdf], fake)
+        self.assertEqual(len(fake.calls["odd.pdf"]), 1 + converter.DEFAULT_RETRIES)
+        self.assertEqual(counts["error"], 1)
+        self.assertEqual(self.quarantined(), {})
+
+    def test_deterministic_error_is_quarantined_and_skipped_next_time(self) -> None:
+        poison, good = self.pdf("poison.pdf"), self.pdf("good.pdf")
+        fake = FakeConversions({"poison.pdf": [("error", ERR_CONVERSION)], "good.pdf": [("ok", "")]})
+        counts, _ = self.run_batch([poison, good], fake)
+        self.assertEqual(len(fake.calls["poison.pdf"]), 1)
+        self.assertEqual((counts["ok"], counts["error"]), (1, 1))
+        self.assertIn(str(poison.resolve()), self.quarantined())
+
+        fake = FakeConversions({"poison.pdf": [("error", ERR_EMPTY)]})
+        counts, errors = self.run_batch([poison], fake)
+        self.assertEqual(fake.calls, {})
+        self.assertEqual((counts["quarantined"], errors), (1, []))
+
+    def test_quarantine_can_be_disabled(self) -> None:
+        poison = self.pdf("poison.pdf")
+        fake = FakeConversions({"poison.pdf": [("error", ERR_CONVERSION)]})
+        self.run_batch([poison], fake, use_quarantine=False)
+        self.assertFalse(self.quarantine_file.exists())
+
+    def test_memory_error_lowers_concurrency(self) -> None:
+        pdf = self.pdf("huge.pdf")
+        fake = FakeConversions({"huge.pdf": [("error", ERR_MEMORY), ("ok", "")]})
+        logging.disable(logging.NOTSET)
+        with self.assertLogs(converter.logger, logging.INFO) as logs:
+            counts, _ = self.run_batch([pdf], fake)
+        self.assertEqual(counts["ok"], 1)
+        self.assertTrue(any("Reduciendo workers a 1" in line for line in logs.output), logs.output)
+
+    def test_late_success_after_a_timeout_clears_the_timeout_count(self) -> None:
+        pdf = self.pdf("slow.pdf")
+        fake = FakeConversions({"slow.pdf": [("ok", "")]}, delay=0.5)
+        counts, errors = self.run_batch([pdf], fake, timeout_secs=0.1)
+        self.assertEqual(counts["error"], 1)
+        self.assertTrue((self.output / "slow.docx").exists())
+        self.assertEqual(self.quarantined(), {})
+
+    def test_existing_docx_clears_an_earlier_timeout_count(self) -> None:
+        pdf = self.pdf("slow.pdf")
+        converter.Quarantine(self.quarantine_file).record_timeout(pdf, "Timeout > 1s", limit=2)
+        self.output.mkdir(parents=True, exist_ok=True)
+        (self.output / "slow.docx").write_bytes(b"docx")
+        fake = FakeConversions({"slow.pdf": [("skipped", "")]})
+        self.run_batch([pdf], fake)
+        self.assertEqual(self.quarantined(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
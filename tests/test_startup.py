@@ -0,0 +1,94 @@
+"""
+Startup budget for converter.py.
+
+The CLI is invoked thousands of times from scripts, so importing it (and
+running --help / --list) must not load pdf2docx (PyMuPDF, OpenCV, NumPy)
+or tqdm. Each check runs in a fresh interpreter so earlier imports in the
+test process do not hide a regression.
+"""
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous enough for slow CI machines; importing pdf2docx takes several times this
+IMPORT_BUDGET_SECS = 0.5
+HEAVY_MODULES = ("pdf2docx", "fitz", "cv2", "numpy", "docx", "tqdm")
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+class StartupTest(unittest.TestCase):
+
+    def test_import_is_lazy_and_within_budget(self) -> None:
+        result = run_python(
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import converter\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+            "print(elapsed)\n"
+            "print(','.join(loaded))\n"
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        elapsed_line, loaded_line = result.stdout.splitlines()[-2:]
+        self.assertEqual(loaded_line, "", f"imported at startup: {loaded_line}")
+        self.assertLess(float(elapsed_line), IMPORT_BUDGET_SECS)
+
+    def test_list_mode_does_not_load_converter_dependencies(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "a.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4\n")
+            result = run_python(
+                "import sys\n"
+                "import converter\n"
+                f"sys.argv = ['converter.py', '--input', {tmp!r}, '--input', 'missing.txt', '--list']\n"
+                "converter.main()\n"
+                f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+                "assert not loaded, loaded\n"
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            # Only the paths on stdout; warnings about missing.txt go to stderr
+            self.assertEqual(result.stdout.splitlines(), [str(pdf_path)])
+
+    def test_dry_run_keeps_logs_out_of_the_plan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "a.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4\n")
+            output_dir = Path(tmp) / "out"
+            output_dir.mkdir()
+            st = pdf_path.stat()
+            # A quarantine file makes Quarantine() log while it loads
+            (output_dir / ".pdf2docx_quarantine.json").write_text(
+                json.dumps({str(pdf_path.resolve()): {
+                    "code": "conversion", "error": "boom", "size": st.st_size, "mtime": st.st_mtime,
+                }}),
+                encoding="utf-8",
+            )
+            result = run_python(
+                "import sys\n"
+                "import converter\n"
+                f"sys.argv = ['converter.py', '--input', {tmp!r}, '--output', {str(output_dir)!r}, '--dry-run']\n"
+                "converter.main()\n"
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn("Cuarentena cargada", result.stderr)
+            lines = result.stdout.splitlines()
+            self.assertTrue(lines[0].startswith("quarantined"), result.stdout)
+            self.assertNotIn(" - INFO - ", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()